@@ -0,0 +1,30 @@
+-- Indexes declared on the Bot model (src/jm_api/models/bot.py).
+-- The app never runs create_all and there are no migrations, so apply this
+-- by hand on existing databases. Every statement is idempotent:
+--
+--   psql "$DATABASE_URL" -f sql/bots_indexes.sql
+--
+-- Indexes are built CONCURRENTLY so writes to bots continue during the build.
+-- CONCURRENTLY cannot run inside a transaction block: do not pass -1 /
+-- --single-transaction. A build that fails part-way leaves an INVALID index
+-- that IF NOT EXISTS would skip; drop it (DROP INDEX CONCURRENTLY <name>) and
+-- run the file again.
+
+\set ON_ERROR_STOP on
+
+-- Default list sort: create_at DESC, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bots_create_at_id ON bots (create_at DESC, id DESC);
+
+-- Equality filters followed by the full sort key, so filtered pages are read
+-- in index order
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bots_rig_id_create_at ON bots (rig_id, create_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bots_kill_switch_create_at ON bots (kill_switch, create_at DESC, id DESC);
+
+-- last_run_at date-range filter
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bots_last_run_at ON bots (last_run_at DESC);
+
+-- PostgreSQL only: trigram index so log_search's ILIKE '%term%' can use an
+-- index. Needs the pg_trgm extension (contrib; superuser or a trusted
+-- extension on managed databases).
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bots_last_run_log_trgm ON bots USING gin (last_run_log gin_trgm_ops);
@@ -0,0 +1,66 @@
+"""In-process cache of unfiltered row counts for generic list endpoints."""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+# model -> (monotonic timestamp, count)
+_cache: dict[type, tuple[float, int]] = {}
+_tracked: set[type] = set()
+# Session.info key for models written in the session's current transaction
+_PENDING_KEY = "count_cache_pending"
+
+
+def get_cached_count(model: type, ttl: float) -> int | None:
+    """Return the cached unfiltered count for ``model`` if younger than ``ttl`` seconds."""
+    entry = _cache.get(model)
+    if entry is None:
+        return None
+    cached_at, count = entry
+    if time.monotonic() - cached_at > ttl:
+        return None
+    return count
+
+
+def set_cached_count(model: type, count: int) -> None:
+    _cache[model] = (time.monotonic(), count)
+
+
+def invalidate_count(model: type) -> None:
+    _cache.pop(model, None)
+
+
+def clear_count_cache() -> None:
+    _cache.clear()
+
+
+def _invalidate_committed(session: Session) -> None:
+    for model in session.info.pop(_PENDING_KEY, ()):
+        invalidate_count(model)
+
+
+def track_count_invalidation(model: type) -> None:
+    """Drop the cached count whenever the ORM inserts or deletes a ``model`` row.
+
+    The count is dropped at flush and again once the session commits: a list
+    request served between the two still sees the old count and may re-cache
+    it. Writes from other processes (or Core bulk statements) are not seen;
+    the TTL passed to ``get_cached_count`` bounds how stale the count can get.
+    """
+    if model in _tracked:
+        return
+    if not _tracked:
+        event.listen(Session, "after_commit", _invalidate_committed)
+
+    def _invalidate(mapper, connection, target) -> None:
+        invalidate_count(model)
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(_PENDING_KEY, set()).add(model)
+
+    event.listen(model, "after_insert", _invalidate)
+    event.listen(model, "after_delete", _invalidate)
+    _tracked.add(model)
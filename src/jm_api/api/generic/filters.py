@@ -7,8 +7,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from sqlalchemy import literal
 from sqlalchemy.sql import Select
 
+# Backslash-escape LIKE wildcards (and the escape character itself) in one pass
+_LIKE_ESCAPE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
 
 class FilterType(Enum):
     """Supported filter types."""
@@ -61,14 +65,16 @@ def apply_filters(
             value = filter_values.get(field.effective_param_name)
             if value is not None:
                 column = getattr(model, field.column_name)
-                query = query.where(column == value)
+                # Always bind the value: a bare ``column == True`` renders the
+                # literal "true", giving each boolean value its own cache entry.
+                query = query.where(column == literal(value, column.type))
 
         elif field.filter_type == FilterType.ILIKE:
             value = filter_values.get(field.effective_param_name)
             if value is not None:
                 column = getattr(model, field.column_name)
                 # Escape SQL wildcards to prevent injection
-                escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                escaped = value.translate(_LIKE_ESCAPE)
                 query = query.where(column.ilike(f"%{escaped}%", escape="\\"))
 
         elif field.filter_type == FilterType.DATE_RANGE:
@@ -0,0 +1,109 @@
+"""Keyset (cursor) pagination for generic list endpoints."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _decode_value(value: Any, column: Any) -> Any:
+    """Check a cursor slot against its column's Python type, parsing ISO dates."""
+    try:
+        expected = column.type.python_type
+    except NotImplementedError:
+        raise InvalidCursorError("Invalid cursor") from None
+
+    if issubclass(expected, date):  # also covers datetime
+        if not isinstance(value, str):
+            raise InvalidCursorError("Invalid cursor")
+        try:
+            return expected.fromisoformat(value)
+        except ValueError as exc:
+            raise InvalidCursorError("Invalid cursor") from exc
+    if expected is float and type(value) is int:
+        return float(value)
+    # Exact match: JSON true/false must not pass as an int, nor null as anything
+    if type(value) is not expected:
+        raise InvalidCursorError("Invalid cursor")
+    return value
+
+
+def encode_cursor(item: Any, sort_columns: list[tuple[str, str]]) -> str:
+    """Encode an item's sort-column values as an opaque URL-safe cursor.
+
+    Args:
+        item: Last row of the current page.
+        sort_columns: List of (column_name, direction) tuples used for ORDER BY.
+
+    Returns:
+        URL-safe base64 string identifying the position after ``item``.
+    """
+    values = [_encode_value(getattr(item, col_name)) for col_name, _ in sort_columns]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    model: type,
+    sort_columns: list[tuple[str, str]],
+) -> list[Any]:
+    """Decode a cursor produced by ``encode_cursor`` back into column values.
+
+    Each value must match its column's Python type, so a tampered cursor is
+    rejected here rather than failing in the database.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or doesn't match sort_columns.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != len(sort_columns):
+        raise InvalidCursorError("Invalid cursor")
+
+    return [
+        _decode_value(value, getattr(model, col_name))
+        for (col_name, _), value in zip(sort_columns, values)
+    ]
+
+
+def apply_cursor(
+    query: Select,
+    model: type,
+    sort_columns: list[tuple[str, str]],
+    values: list[Any],
+) -> Select:
+    """Restrict a query to rows strictly after the cursor position.
+
+    Builds the lexicographic condition for the (possibly mixed-direction)
+    ORDER BY, e.g. ``create_at < :c OR (create_at = :c AND id < :i)``.
+    """
+    clauses = []
+    for i, (col_name, direction) in enumerate(sort_columns):
+        column = getattr(model, col_name)
+        value = values[i]
+        beyond = column < value if direction == "desc" else column > value
+        ties = [
+            getattr(model, prev_name) == values[j]
+            for j, (prev_name, _) in enumerate(sort_columns[:i])
+        ]
+        clauses.append(and_(*ties, beyond))
+    return query.where(or_(*clauses))
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import dataclasses
-import math
+import json
+from collections.abc import Callable
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import Response
+from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -15,7 +18,50 @@ from starlette.status import HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_409_CON
 from jm_api.db.session import get_db
 from jm_api.schemas.generic import ListResponse, NotFoundError
 
+from .counts import get_cached_count, set_cached_count, track_count_invalidation
 from .filters import FilterField, apply_filters, make_filter_dependency
+from .pagination import InvalidCursorError, apply_cursor, decode_cursor, encode_cursor
+
+# Default path ID pattern: 32 alphanumeric characters (see TimestampedIdBase).
+# Path(pattern=...) hands it to pydantic-core, which compiles it once when the
+# route is built and matches it in Rust on each request.
+ID_PATTERN = r"^[a-zA-Z0-9]{32}$"
+
+# Label for the COUNT(*) OVER () column added to offset-paginated list queries
+_TOTAL_LABEL = "list_total"
+
+
+def _json_response(payload: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a validated schema straight to JSON bytes.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    dict round-trip; response_model is still declared for the OpenAPI schema.
+    """
+    return Response(
+        content=payload.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _not_found_responder(resource_name: str) -> Callable[[str], Response]:
+    """Build a 404 responder whose JSON body is pre-rendered around the id.
+
+    Produces the same ``{"detail": {"message": ..., "id": ...}}`` body as
+    raising HTTPException, without the exception unwind and dict encoding on
+    every miss; only the id is encoded per call.
+    """
+    message = json.dumps(f"{resource_name} not found", ensure_ascii=False)
+    head = f'{{"detail":{{"message":{message},"id":'.encode()
+
+    def not_found(item_id: str) -> Response:
+        return Response(
+            content=head + json.dumps(item_id, ensure_ascii=False).encode() + b"}}",
+            status_code=404,
+            media_type="application/json",
+        )
+
+    return not_found
 
 
 def create_read_router(
@@ -26,8 +72,10 @@ def create_read_router(
     response_schema: type,
     filter_config: list[FilterField],
     resource_name: str,
-    id_pattern: str = r"^[a-zA-Z0-9]{32}$",
+    id_pattern: str = ID_PATTERN,
     sort_columns: list[tuple[str, str]] | None = None,
+    count_cache_ttl: float | Callable[[], float] = 0,
+    list_schema: type | None = None,
 ) -> APIRouter:
     """Create an APIRouter with list and get-by-id endpoints.
 
@@ -41,35 +89,79 @@ def create_read_router(
         id_pattern: Regex pattern for path ID validation.
         sort_columns: List of (column_name, direction) tuples for ORDER BY.
             Defaults to [("create_at", "desc"), ("id", "desc")].
+        count_cache_ttl: Seconds to cache the unfiltered COUNT(*) used for
+            "total". 0 (default) disables caching. The cache is dropped on ORM
+            inserts/deletes in this process; the TTL bounds staleness otherwise.
+            A callable is read on each request, so the TTL can come from
+            settings that aren't loaded yet when the router is built.
+        list_schema: Pydantic schema for list items. Defaults to response_schema.
+            The list query selects only the columns this schema declares, so a
+            narrower schema keeps wide columns out of list pages, and every
+            field must therefore be a table column (not a property,
+            hybrid or relationship); ValueError otherwise.
 
     Returns:
         Configured APIRouter with GET "" and GET "/{item_id}" routes.
     """
     if sort_columns is None:
         sort_columns = [("create_at", "desc"), ("id", "desc")]
+    if callable(count_cache_ttl) or count_cache_ttl > 0:
+        track_count_invalidation(model)
+
+    if list_schema is None:
+        list_schema = response_schema
+    # Project plain columns rather than whole entities: rows skip ORM identity
+    # map bookkeeping and columns absent from list_schema are never fetched.
+    # Sort columns are always included so next_cursor can be encoded.
+    column_names = model.__table__.columns.keys()
+    non_columns = [name for name in list_schema.model_fields if name not in column_names]
+    if non_columns:
+        raise ValueError(
+            f"{list_schema.__name__} fields {non_columns} are not columns of "
+            f"{model.__tablename__}; list pages select table columns only."
+        )
+    list_column_names = [
+        name for name in column_names if name in list_schema.model_fields
+    ] + [
+        col_name
+        for col_name, _ in sort_columns
+        if col_name not in list_schema.model_fields
+    ]
+    list_columns = [getattr(model, name) for name in list_column_names]
 
     router = APIRouter(prefix=prefix, tags=tags)
     filter_dep = make_filter_dependency(filter_config, resource_name=resource_name)
-    list_response_model = ListResponse[response_schema]
+    list_response_model = ListResponse[list_schema]
     name_lower = resource_name.lower()
+    not_found = _not_found_responder(resource_name)
 
     @router.get("", response_model=list_response_model, name=f"list_{name_lower}s")
     def list_items(
         page: int = Query(default=1, ge=1),
         per_page: int = Query(default=20, ge=1, le=100),
+        cursor: str | None = Query(
+            default=None,
+            description="Keyset cursor from a previous response's next_cursor. "
+            "When given, rows after the cursor are returned and page is not used "
+            "for the offset.",
+        ),
         filters: Any = Depends(filter_dep),
         db: Session = Depends(get_db),
-    ) -> dict:
+    ) -> Response:
         filter_values = dataclasses.asdict(filters)
 
-        # Count query
-        count_query = apply_filters(
-            select(func.count()).select_from(model), model, filter_config, filter_values
-        )
-        total = db.execute(count_query).scalar() or 0
-
         # Data query
-        data_query = apply_filters(select(model), model, filter_config, filter_values)
+        data_query = apply_filters(select(*list_columns), model, filter_config, filter_values)
+
+        if cursor is not None:
+            try:
+                cursor_values = decode_cursor(cursor, model, sort_columns)
+            except InvalidCursorError:
+                raise HTTPException(
+                    status_code=422,
+                    detail={"message": "Invalid cursor", "cursor": cursor},
+                ) from None
+            data_query = apply_cursor(data_query, model, sort_columns, cursor_values)
 
         # Apply sort order
         order_clauses = []
@@ -78,19 +170,60 @@ def create_read_router(
             order_clauses.append(column.desc() if direction == "desc" else column.asc())
         data_query = data_query.order_by(*order_clauses)
 
-        offset = (page - 1) * per_page
-        data_query = data_query.offset(offset).limit(per_page)
-
-        items = db.execute(data_query).scalars().all()
-        pages = math.ceil(total / per_page) if total > 0 else 0
-
-        return {
-            "items": [response_schema.model_validate(item) for item in items],
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-            "pages": pages,
-        }
+        # Keyset pages seek past the cursor instead of skipping rows
+        offset = 0 if cursor is not None else (page - 1) * per_page
+        # One extra row tells whether another page follows, so a final full
+        # page doesn't hand out a cursor to an empty page.
+        data_query = data_query.offset(offset).limit(per_page + 1)
+
+        unfiltered = all(value is None for value in filter_values.values())
+        ttl = count_cache_ttl() if callable(count_cache_ttl) else count_cache_ttl
+        cache_total = unfiltered and ttl > 0
+        cached = get_cached_count(model, ttl) if cache_total else None
+
+        # Offset pages read the filtered total from COUNT(*) OVER () on the
+        # page query itself, saving a round trip. Keyset pages can't: the
+        # window would only count rows past the cursor.
+        window_total = cursor is None and cached is None
+        if window_total:
+            data_query = data_query.add_columns(func.count().over().label(_TOTAL_LABEL))
+
+        items = db.execute(data_query).all()
+        has_more = len(items) > per_page
+        items = items[:per_page]
+
+        if window_total and (items or offset == 0):
+            total = items[0]._mapping[_TOTAL_LABEL] if items else 0
+        elif cached is not None:
+            total = cached
+        else:
+            # Keyset pages, and offset pages past the end (no row to carry the
+            # window value), fall back to a separate COUNT.
+            count_query = apply_filters(
+                select(func.count()).select_from(model), model, filter_config, filter_values
+            )
+            total = db.execute(count_query).scalar() or 0
+        if cache_total and cached is None:
+            set_cached_count(model, total)
+
+        pages = -(-total // per_page)  # integer ceil division; 0 when total is 0
+
+        # Validate the whole envelope from ORM attributes in one pydantic-core
+        # call rather than a Python-level model_validate per row.
+        envelope = list_response_model.model_validate(
+            {
+                "items": items,
+                "total": total,
+                "page": page,
+                "per_page": per_page,
+                "pages": pages,
+                "next_cursor": (
+                    encode_cursor(items[-1], sort_columns) if has_more else None
+                ),
+            },
+            from_attributes=True,
+        )
+        return _json_response(envelope)
 
     @router.get(
         "/{item_id}",
@@ -101,14 +234,11 @@ def create_read_router(
     def get_item(
         item_id: str = Path(pattern=id_pattern),
         db: Session = Depends(get_db),
-    ) -> Any:
+    ) -> Response:
         item = db.get(model, item_id)
         if item is None:
-            raise HTTPException(
-                status_code=404,
-                detail={"message": f"{resource_name} not found", "id": item_id},
-            )
-        return response_schema.model_validate(item)
+            return not_found(item_id)
+        return _json_response(response_schema.model_validate(item))
 
     # Rename functions for unique OpenAPI operation_ids across multiple routers
     list_items.__name__ = f"list_{name_lower}s"
@@ -146,10 +276,15 @@ def create_create_router(
     # We can't use `payload: create_schema` directly because
     # `from __future__ import annotations` turns it into a string literal.
     # Instead, we set __annotations__ manually on the function.
-    def create_item(payload, *, db: Session = Depends(get_db)) -> Any:
+    def create_item(payload, *, db: Session = Depends(get_db)) -> Response:
         item = model(**payload.model_dump())
         db.add(item)
         try:
+            # Serialize after the INSERT but before commit expires the instance,
+            # so no refresh SELECT is needed. Client-side defaults are already
+            # set and server-side ones come back via eager defaults.
+            db.flush()
+            response = response_schema.model_validate(item)
             db.commit()
         except IntegrityError as exc:
             db.rollback()
@@ -157,8 +292,7 @@ def create_create_router(
                 status_code=HTTP_409_CONFLICT,
                 detail=f"Record conflicts with an existing entry: {exc.orig}",
             ) from None
-        db.refresh(item)
-        return response_schema.model_validate(item)
+        return _json_response(response, HTTP_201_CREATED)
 
     create_item.__annotations__["payload"] = create_schema
     create_item.__name__ = f"create_{name_lower}"
@@ -183,7 +317,7 @@ def create_update_router(
     response_schema: type,
     update_schema: type,
     resource_name: str,
-    id_pattern: str = r"^[a-zA-Z0-9]{32}$",
+    id_pattern: str = ID_PATTERN,
 ) -> APIRouter:
     """Create an APIRouter with a PUT endpoint for updating records.
 
@@ -203,20 +337,18 @@ def create_update_router(
     """
     router = APIRouter(prefix=prefix, tags=tags)
     name_lower = resource_name.lower()
+    not_found = _not_found_responder(resource_name)
 
-    def update_item(item_id, payload, *, db: Session = Depends(get_db)) -> Any:
+    def update_item(item_id, payload, *, db: Session = Depends(get_db)) -> Response:
         item = db.get(model, item_id)
         if item is None:
-            raise HTTPException(
-                status_code=404,
-                detail={"message": f"{resource_name} not found", "id": item_id},
-            )
+            return not_found(item_id)
         update_data = payload.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(item, field, value)
         db.commit()
         db.refresh(item)
-        return response_schema.model_validate(item)
+        return _json_response(response_schema.model_validate(item))
 
     update_item.__annotations__["item_id"] = Annotated[
         str, Path(pattern=id_pattern)
@@ -242,7 +374,7 @@ def create_delete_router(
     tags: list[str],
     model: type,
     resource_name: str,
-    id_pattern: str = r"^[a-zA-Z0-9]{32}$",
+    id_pattern: str = ID_PATTERN,
 ) -> APIRouter:
     """Create an APIRouter with a DELETE endpoint for removing records.
 
@@ -258,14 +390,12 @@ def create_delete_router(
     """
     router = APIRouter(prefix=prefix, tags=tags)
     name_lower = resource_name.lower()
+    not_found = _not_found_responder(resource_name)
 
-    def delete_item(item_id, *, db: Session = Depends(get_db)) -> None:
+    def delete_item(item_id, *, db: Session = Depends(get_db)) -> Response | None:
         item = db.get(model, item_id)
         if item is None:
-            raise HTTPException(
-                status_code=404,
-                detail={"message": f"{resource_name} not found", "id": item_id},
-            )
+            return not_found(item_id)
         db.delete(item)
         db.commit()
 
@@ -279,6 +409,7 @@ def create_delete_router(
         delete_item,
         methods=["DELETE"],
         status_code=HTTP_204_NO_CONTENT,
+        response_model=None,
         responses={404: {"model": NotFoundError}},
         name=f"delete_{name_lower}",
     )
@@ -11,6 +11,7 @@ from jm_api.api.generic import (
     create_update_router,
 )
 from jm_api.api.generic.filters import FilterField, FilterType
+from jm_api.core.config import get_settings
 from jm_api.models.bot import Bot
 from jm_api.schemas.bot import BotCreate, BotResponse, BotUpdate
 
@@ -30,6 +31,7 @@ _read_router = create_read_router(
     response_schema=BotResponse,
     filter_config=BOT_FILTERS,
     resource_name="Bot",
+    count_cache_ttl=lambda: get_settings().count_cache_ttl,
 )
 
 _create_router = create_create_router(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -11,12 +12,18 @@ from jm_api.api.router import router as api_router
 from jm_api.core.config import get_settings
 from jm_api.core.lifespan import lifespan
 from jm_api.core.logging import configure_logging
+from jm_api.middleware.etag import ETagMiddleware
 from jm_api.middleware.request_id import RequestIdMiddleware
 
 _STATIC_DIR = Path(__file__).resolve().parent / "static"
 
 
+@lru_cache(maxsize=1)
 def create_app() -> FastAPI:
+    """Build the application once; later calls return the same instance.
+
+    Call ``create_app.cache_clear()`` after changing settings to rebuild.
+    """
     settings = get_settings()
     configure_logging(settings.log_level)
 
@@ -30,6 +37,7 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    app.add_middleware(ETagMiddleware)
     app.add_middleware(RequestIdMiddleware, header_name=settings.request_id_header)
 
     if settings.allowed_hosts:
@@ -48,4 +56,9 @@ def create_app() -> FastAPI:
 
     app.mount("/admin", StaticFiles(directory=str(_STATIC_DIR)), name="admin")
 
+    if settings.docs_enabled:
+        # Build (and cache on the app) the OpenAPI schema now rather than on
+        # the first /openapi.json request; model validators are already compiled.
+        app.openapi()
+
     return app
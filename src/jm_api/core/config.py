@@ -30,6 +30,16 @@ class Settings(BaseSettings):
                 )
         return self
 
+    # Connection pool sizing for server databases (ignored for SQLite).
+    # Sync handlers run in AnyIO's worker threads (40 by default), so the pool
+    # bounds how many requests can hold a connection at once.
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+
+    # Seconds the unfiltered list total is reused before being recounted.
+    # 0 disables the cache.
+    count_cache_ttl: float = Field(default=5.0, ge=0)
+
     api_v1_prefix: str = Field(default="/api/v1")
 
     docs_enabled: bool = Field(default=True)
@@ -52,6 +62,10 @@ class Settings(BaseSettings):
         env_prefix="JM_API_",
         env_file=".env",
         case_sensitive=False,
+        # get_settings() shares one instance process-wide, so make it read-only.
+        # Defaults are trusted literals; only supplied values need validating.
+        frozen=True,
+        validate_default=False,
     )
 
     @field_validator("allow_origins", "allowed_hosts", mode="before")
@@ -64,6 +78,6 @@ class Settings(BaseSettings):
         return value
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
@@ -20,7 +20,13 @@ def init_db(app: FastAPI) -> None:
     Should be called during FastAPI lifespan startup.
     """
     settings = get_settings()
-    engine = create_engine(settings.database_url)
+    engine_kwargs = {}
+    if not settings.database_url.startswith("sqlite"):
+        engine_kwargs = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+        }
+    engine = create_engine(settings.database_url, **engine_kwargs)
     session_factory = sessionmaker(
         autocommit=False,
         autoflush=False,
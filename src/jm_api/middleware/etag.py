@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hashlib
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Headers describing the body; dropped from 304 responses, which have none.
+_BODY_HEADERS = {"content-length", "content-type", "content-encoding"}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """Add an ETag to successful GET responses and answer If-None-Match with 304."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or not 200 <= response.status_code < 300
+            or "etag" in response.headers
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            headers = {
+                key: value
+                for key, value in response.headers.items()
+                if key not in _BODY_HEADERS
+            }
+            headers["ETag"] = etag
+            return Response(status_code=304, headers=headers)
+
+        cached = Response(
+            content=body,
+            status_code=response.status_code,
+            background=response.background,
+        )
+        cached.raw_headers = list(response.raw_headers)
+        cached.headers["ETag"] = etag
+        return cached
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import DDL, Boolean, DateTime, Index, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from jm_api.db.base import TimestampedIdBase
@@ -15,3 +15,26 @@ class Bot(TimestampedIdBase):
     last_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
     kill_switch: Mapped[bool] = mapped_column(Boolean, default=False)
     last_run_log: Mapped[str | None] = mapped_column(Text, default="")
+
+
+# Indexes matching the list endpoint's default sort (create_at DESC, id DESC)
+# and its filter + sort combinations: equality columns first, then the full
+# sort key so filtered pages are read in index order. Declared after the class
+# because create_at/id are inherited from TimestampedIdBase.
+Index("ix_bots_create_at_id", Bot.create_at.desc(), Bot.id.desc())
+Index("ix_bots_rig_id_create_at", Bot.rig_id, Bot.create_at.desc(), Bot.id.desc())
+Index("ix_bots_kill_switch_create_at", Bot.kill_switch, Bot.create_at.desc(), Bot.id.desc())
+Index("ix_bots_last_run_at", Bot.last_run_at.desc())
+
+# Trigram index so log_search's ILIKE '%term%' is index-backed on PostgreSQL.
+event.listen(
+    Bot.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+Index(
+    "ix_bots_last_run_log_trgm",
+    Bot.last_run_log,
+    postgresql_using="gin",
+    postgresql_ops={"last_run_log": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
@@ -17,6 +17,7 @@ class ListResponse(BaseModel, Generic[T]):
     page: int
     per_page: int
     pages: int
+    next_cursor: str | None = None
 
 
 class NotFoundError(BaseModel):
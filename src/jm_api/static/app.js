@@ -29,7 +29,7 @@ function escapeHtml(str) {
 /**
  * Discover filterable fields from the OpenAPI spec for a given table.
  * Fetches /openapi.json, extracts GET query parameters, excludes pagination
- * params (page, per_page), and groups DATE_RANGE _after/_before pairs.
+ * params (page, per_page, cursor), and groups DATE_RANGE _after/_before pairs.
  */
 function discoverFilterFields(spec, table) {
   var pathKey = "/api/v1/" + table;
@@ -37,7 +37,7 @@ function discoverFilterFields(spec, table) {
   if (!pathObj || !pathObj.get) return [];
 
   var parameters = pathObj.get.parameters || [];
-  var paginationParams = ["page", "per_page"];
+  var paginationParams = ["page", "per_page", "cursor"];
   var fields = [];
   var dateRangeGroups = {};
 
@@ -1,17 +1,29 @@
 """Shared test fixtures."""
 
+from contextlib import contextmanager
 from datetime import datetime
 
+import httpx
+import orjson
 import pytest
 import sqlalchemy as sa
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from jm_api.db.base import Base
 from jm_api.models.bot import Bot
 
 
+class OrjsonTestClient(TestClient):
+    """TestClient whose responses decode JSON bodies with orjson."""
+
+    def request(self, *args, **kwargs) -> httpx.Response:
+        response = super().request(*args, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+
 @pytest.fixture(scope="session", autouse=True)
 def set_test_env(monkeypatch_session):
     """Set test environment variables before any tests run.
@@ -24,6 +36,14 @@ def set_test_env(monkeypatch_session):
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_list_count_cache():
+    """Drop cached list totals; per-test rollbacks bypass the ORM invalidation hooks."""
+    from jm_api.api.generic.counts import clear_count_cache
+
+    clear_count_cache()
+
+
 @pytest.fixture(scope="session")
 def monkeypatch_session():
     """Session-scoped monkeypatch for environment setup."""
@@ -33,40 +53,105 @@ def monkeypatch_session():
     mp.undo()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create in-memory SQLite engine for test isolation."""
+    """Create in-memory SQLite engine shared by the whole test session."""
     engine = sa.create_engine(
         "sqlite+pysqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=sa.pool.StaticPool,
     )
+
+    @sa.event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        # Durability is irrelevant for a throwaway in-memory database
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_connection.isolation_level = None
+
+    @sa.event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     yield engine
     engine.dispose()
 
 
 @pytest.fixture
-def db_session(db_engine) -> Session:
-    """Create database session from test engine."""
-    session = Session(db_engine)
+def capture_statements(db_engine):
+    """Context manager recording the SQL sent to an engine inside its block.
+
+    Records on the test engine unless another ``engine`` is passed. Yields a
+    list that fills with ``(statement, context)`` pairs, one per cursor execute.
+    """
+
+    @contextmanager
+    def _capture(engine: sa.Engine | None = None):
+        engine = db_engine if engine is None else engine
+        captured: list[tuple[str, sa.engine.ExecutionContext]] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+            captured.append((statement, context))
+
+        sa.event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield captured
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", _record)
+
+    return _capture
+
+
+@pytest.fixture(scope="session")
+def db_connection(db_engine):
+    """Single connection that every test's transaction runs on."""
+    with db_engine.connect() as connection:
+        yield connection
+
+
+@pytest.fixture(scope="session")
+def db_session_factory(db_connection) -> sessionmaker:
+    """Session factory whose commits become SAVEPOINT releases.
+
+    expire_on_commit=False avoids a reload SELECT on attribute access after commit.
+    """
+    return sessionmaker(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture
+def db_session(db_connection, db_session_factory: sessionmaker) -> Session:
+    """Create a session inside a per-test transaction that is rolled back."""
+    transaction = db_connection.begin()
+    session = db_session_factory()
     yield session
     session.close()
+    transaction.rollback()
 
 
 @pytest.fixture
-def app(db_engine, db_session: Session) -> FastAPI:
-    """Create test app with overridden database dependency."""
-    from sqlalchemy.orm import sessionmaker
+def app(db_session: Session) -> FastAPI:
+    """Create test app with overridden database dependency.
 
+    create_app() is cached, so the same app instance is shared across tests;
+    its overrides are reset for each test. app.state is left alone: the
+    get_db override supplies the session, and the engine the lifespan stored
+    there must stay the one its shutdown disposes.
+    """
     from jm_api.app import create_app
     from jm_api.db.session import get_db
 
     app = create_app()
-
-    # Set up app.state with test engine and session factory
-    app.state.db_engine = db_engine
-    app.state.db_session_factory = sessionmaker(bind=db_engine)
+    app.dependency_overrides.clear()
 
     def override_get_db():
         yield db_session
@@ -75,10 +160,43 @@ def app(db_engine, db_session: Session) -> FastAPI:
     return app
 
 
+@pytest.fixture(scope="session")
+def session_client(set_test_env) -> TestClient:
+    """Test client for the cached app, opened once for the whole session.
+
+    Entering the client keeps one event-loop portal alive, instead of starting
+    a new one for every request made outside a ``with`` block.
+    """
+    from jm_api.app import create_app
+
+    with OrjsonTestClient(create_app()) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(session_client: TestClient) -> dict:
+    """The app's /openapi.json, fetched and parsed once per session.
+
+    Tests must treat it as read-only.
+    """
+    response = session_client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def edit_html_response(session_client: TestClient) -> httpx.Response:
+    """GET /admin/edit.html, fetched once per session for status/header checks."""
+    return session_client.get("/admin/edit.html")
+
+
 @pytest.fixture
-def client(app: FastAPI) -> TestClient:
-    """Create test client."""
-    return TestClient(app)
+def client(app: FastAPI, session_client: TestClient) -> TestClient:
+    """Return the shared test client, bound to this test's app state."""
+    if session_client.app is not app:
+        # create_app's cache was cleared; don't hand out a client for a stale app
+        return OrjsonTestClient(app)
+    return session_client
 
 
 @pytest.fixture
@@ -88,6 +206,7 @@ def bot_factory(db_session: Session):
     Usage:
         def test_something(bot_factory):
             bot = bot_factory(rig_id="my-rig")
+            bots = bot_factory.bulk(25)  # rig-000 .. rig-024 in one commit
     """
 
     def _create_bot(
@@ -114,25 +233,36 @@ def bot_factory(db_session: Session):
             last_run_log=last_run_log,
             last_run_at=last_run_at,
         )
-        db_session.add(bot)
-        db_session.flush()  # Get the ID assigned
-
-        # Override timestamps if specified (for deterministic date filter tests)
-        updates = {}
+        # Override timestamps before the INSERT (for deterministic date filter
+        # tests) so no follow-up UPDATE or refresh is needed
         if create_at is not None:
-            updates["create_at"] = create_at
+            bot.create_at = create_at
         if last_update_at is not None:
-            updates["last_update_at"] = last_update_at
-
-        if updates:
-            db_session.execute(
-                sa.update(Bot)
-                .where(Bot.id == bot.id)
-                .values(**updates)
-            )
+            bot.last_update_at = last_update_at
 
+        db_session.add(bot)
         db_session.commit()
-        db_session.refresh(bot)
         return bot
 
+    def _create_bots(count: int, rig_id: str = "rig-{i:03d}", **fields) -> list[Bot]:
+        """Create and persist ``count`` bots with a single batched INSERT and commit.
+
+        Args:
+            count: Number of bots to create
+            rig_id: Format string for each rig_id, given the bot's index as ``i``
+            **fields: Other Bot column values shared by every bot, including
+                the create_at/last_update_at timestamps
+        """
+        timestamps = {
+            name: fields.pop(name) for name in ("create_at", "last_update_at") if name in fields
+        }
+        bots = [Bot(rig_id=rig_id.format(i=i), **fields) for i in range(count)]
+        for bot in bots:
+            for name, value in timestamps.items():
+                setattr(bot, name, value)
+        db_session.add_all(bots)
+        db_session.commit()
+        return bots
+
+    _create_bot.bulk = _create_bots
     return _create_bot
@@ -0,0 +1,49 @@
+"""CSS parsing helpers shared by the static stylesheet tests."""
+
+import re
+from functools import lru_cache
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_BLOCK_RE = re.compile(r"([^{}]+)\{([^}]*)\}")
+_IMPORTANT_RE = re.compile(r"\s*!\s*important$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4)
+def css_blocks(css: str) -> tuple[tuple[str, str], ...]:
+    """Return (selector, body) tuples from CSS text, parsed once per stylesheet.
+
+    Simple parser — handles single-level blocks only (no nested @media etc.).
+    Strips comments first.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    return tuple(
+        (match.group(1).strip(), match.group(2).strip())
+        for match in _CSS_BLOCK_RE.finditer(css)
+    )
+
+
+def find_blocks(css: str, selector_pattern: str) -> list[str]:
+    """Return CSS bodies for all selectors matching *selector_pattern* (substring)."""
+    return [body for sel, body in css_blocks(css) if selector_pattern in sel]
+
+
+@lru_cache(maxsize=256)
+def css_declarations(body: str) -> frozenset[tuple[str, str]]:
+    """Return the ``(property, value)`` pairs declared in a CSS body.
+
+    Property names are lowercased, values are whitespace-normalised and a
+    trailing ``!important`` is dropped, so ``Cursor: pointer !important``
+    counts as ``("cursor", "pointer")``.
+    """
+    declarations = set()
+    for declaration in body.split(";"):
+        prop, sep, value = declaration.partition(":")
+        if sep:
+            value = _IMPORTANT_RE.sub("", " ".join(value.split()))
+            declarations.add((prop.strip().lower(), value))
+    return frozenset(declarations)
+
+
+def css_has_property(body: str, prop: str, value: str) -> bool:
+    """Check if a CSS body string declares ``prop: value``."""
+    return (prop, value) in css_declarations(body)
@@ -15,10 +15,13 @@ import uvicorn
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
+from jm_api.app import create_app
 from jm_api.core.config import get_settings
 from jm_api.db.base import Base
 
-_SQLITE_PATH = Path("/tmp/jm_integration_test.db")
+# Per-worker file so pytest-xdist workers don't share one database
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+_SQLITE_PATH = Path(f"/tmp/jm_integration_test_{_WORKER_ID}.db")
 _DATABASE_URL = f"sqlite:///{_SQLITE_PATH}"
 
 
@@ -38,6 +41,7 @@ def integration_server():
     # 1. Point the app at the integration test database.
     os.environ["JM_API_DATABASE_URL"] = _DATABASE_URL
     get_settings.cache_clear()
+    create_app.cache_clear()
 
     settings = get_settings()
 
@@ -63,7 +63,7 @@ class TestBotListEndpoint:
             assert resp.status_code == 200
             body = resp.json()
             items = body["items"]
-            assert any(item["rig_id"] == "test-rig" for item in items)
+            assert "test-rig" in {item["rig_id"] for item in items}
         finally:
             db_session.delete(bot)
             db_session.commit()
@@ -9,6 +9,7 @@ Tests cover all four sub-tasks from spec.txt:
 """
 
 import pathlib
+from functools import lru_cache
 
 import pytest
 from fastapi.testclient import TestClient
@@ -21,13 +22,20 @@ from fastapi.testclient import TestClient
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
 
+@lru_cache(maxsize=8)
 def _read_static(filename: str) -> str:
-    """Read a static file's text content from disk."""
+    """Read a static file's text content from disk, once per filename."""
     path = STATIC_DIR / filename
     assert path.exists(), f"Expected static file not found: {path}"
     return path.read_text()
 
 
+@lru_cache(maxsize=8)
+def _read_static_lower(filename: str) -> str:
+    """Lowercased static file content, for case-insensitive tag checks."""
+    return _read_static(filename).lower()
+
+
 # ===================================================================
 # Sub-task 1: Static file serving
 # ===================================================================
@@ -101,7 +109,7 @@ class TestIndexPageContent:
     @pytest.fixture(autouse=True)
     def _load_html(self) -> None:
         self.html = _read_static("index.html")
-        self.html_lower = self.html.lower()
+        self.html_lower = _read_static_lower("index.html")
 
     # -- Semantic HTML --
 
@@ -152,7 +160,7 @@ class TestTablePageContent:
     @pytest.fixture(autouse=True)
     def _load_html(self) -> None:
         self.html = _read_static("table.html")
-        self.html_lower = self.html.lower()
+        self.html_lower = _read_static_lower("table.html")
 
     # -- Semantic structure --
 
@@ -200,7 +208,7 @@ class TestStyleCssContent:
     @pytest.fixture(autouse=True)
     def _load_css(self) -> None:
         self.css = _read_static("style.css")
-        self.css_lower = self.css.lower()
+        self.css_lower = _read_static_lower("style.css")
 
     def test_system_font_stack(self) -> None:
         """CSS must use a system font stack."""
@@ -256,6 +264,7 @@ class TestAppJsContent:
     @pytest.fixture(autouse=True)
     def _load_js(self) -> None:
         self.js = _read_static("app.js")
+        self.js_lower = _read_static_lower("app.js")
 
     # -- TABLES array --
 
@@ -326,7 +335,7 @@ class TestAppJsContent:
 
     def test_shows_loading_indicator(self) -> None:
         """app.js must show/hide a loading indicator."""
-        assert "loading" in self.js.lower()
+        assert "loading" in self.js_lower
 
     # -- Error handling --
 
@@ -340,7 +349,7 @@ class TestAppJsContent:
 
     def test_displays_error_message(self) -> None:
         """app.js must display an error message to the user on failure."""
-        assert "error" in self.js.lower()
+        assert "error" in self.js_lower
 
 
 # ===================================================================
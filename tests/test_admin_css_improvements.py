@@ -10,50 +10,27 @@ Spec tasks:
 
 import pathlib
 import re
+from functools import lru_cache
 
 import pytest
 
+from css_helpers import css_blocks, css_has_property, find_blocks
+
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
 
+@lru_cache(maxsize=8)
 def _read_static(filename: str) -> str:
-    """Read a static file from disk."""
+    """Read a static file from disk, once per filename."""
     path = STATIC_DIR / filename
     assert path.exists(), f"Expected static file not found: {path}"
     return path.read_text()
 
 
-# ---------------------------------------------------------------------------
-# Helpers for CSS parsing
-# ---------------------------------------------------------------------------
-
-
-def _css_blocks(css: str) -> list[tuple[str, str]]:
-    """Return list of (selector, body) tuples from CSS text.
-
-    Simple parser — handles single-level blocks only (no nested @media etc.).
-    Strips comments first.
-    """
-    # Strip /* ... */ comments
-    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
-    blocks: list[tuple[str, str]] = []
-    for match in re.finditer(r"([^{}]+)\{([^}]*)\}", css):
-        selector = match.group(1).strip()
-        body = match.group(2).strip()
-        blocks.append((selector, body))
-    return blocks
-
-
-def _find_blocks(css: str, selector_pattern: str) -> list[str]:
-    """Return CSS bodies for all selectors matching *selector_pattern* (substring)."""
-    return [body for sel, body in _css_blocks(css) if selector_pattern in sel]
-
-
-def _css_has_property(body: str, prop: str, value: str) -> bool:
-    """Check if a CSS body string contains ``prop: value``."""
-    # Normalise whitespace around colons and semicolons
-    pattern = rf"{re.escape(prop)}\s*:\s*{re.escape(value)}"
-    return bool(re.search(pattern, body))
+@lru_cache(maxsize=8)
+def _read_static_lower(filename: str) -> str:
+    """Lowercased static file content, for case-insensitive checks."""
+    return _read_static(filename).lower()
 
 
 # ===================================================================
@@ -72,9 +49,9 @@ class TestButtonTableSpacing:
 
     def test_add_record_btn_has_margin_bottom(self) -> None:
         """#add-record-btn must have margin-bottom: 1.5rem."""
-        btn_blocks = _find_blocks(self.css, "#add-record-btn")
+        btn_blocks = find_blocks(self.css, "#add-record-btn")
         has_margin = any(
-            _css_has_property(body, "margin-bottom", "1.5rem")
+            css_has_property(body, "margin-bottom", "1.5rem")
             for body in btn_blocks
         )
         assert has_margin, (
@@ -92,11 +69,11 @@ class TestButtonTableSpacing:
         # Find blocks where selector is exactly ".btn" (not .btn-primary, etc.)
         exact_btn_blocks = [
             body
-            for sel, body in _css_blocks(self.css)
+            for sel, body in css_blocks(self.css)
             if re.fullmatch(r"\.btn", sel.strip())
         ]
         has_margin = any(
-            _css_has_property(body, "margin-bottom", "1.5rem")
+            css_has_property(body, "margin-bottom", "1.5rem")
             for body in exact_btn_blocks
         )
         assert not has_margin, (
@@ -133,11 +110,11 @@ class TestTableBorderRadius:
         """
         exact_table_blocks = [
             body
-            for sel, body in _css_blocks(self.css)
+            for sel, body in css_blocks(self.css)
             if re.fullmatch(r"table", sel.strip())
         ]
         has_radius = any(
-            _css_has_property(body, "border-radius", "4px")
+            css_has_property(body, "border-radius", "4px")
             for body in exact_table_blocks
         )
         assert not has_radius, (
@@ -147,9 +124,9 @@ class TestTableBorderRadius:
 
     def test_table_wrapper_has_border_radius(self) -> None:
         """The '.table-wrapper' selector must include border-radius: 4px."""
-        wrapper_blocks = _find_blocks(self.css, ".table-wrapper")
+        wrapper_blocks = find_blocks(self.css, ".table-wrapper")
         has_radius = any(
-            _css_has_property(body, "border-radius", "4px")
+            css_has_property(body, "border-radius", "4px")
             for body in wrapper_blocks
         )
         assert has_radius, (
@@ -159,9 +136,9 @@ class TestTableBorderRadius:
     def test_table_wrapper_has_overflow_hidden(self) -> None:
         """The '.table-wrapper' must have overflow: hidden to clip the table
         corners to the wrapper's border-radius."""
-        wrapper_blocks = _find_blocks(self.css, ".table-wrapper")
+        wrapper_blocks = find_blocks(self.css, ".table-wrapper")
         has_overflow = any(
-            _css_has_property(body, "overflow", "hidden")
+            css_has_property(body, "overflow", "hidden")
             for body in wrapper_blocks
         )
         assert has_overflow, (
@@ -180,7 +157,7 @@ class TestBackToDashboardLink:
     def test_table_html_has_back_link(self) -> None:
         """table.html must contain a link back to the dashboard."""
         html = _read_static("table.html")
-        html_lower = html.lower()
+        html_lower = _read_static_lower("table.html")
         # Must have an anchor linking to index.html (or /admin or /admin/)
         has_back_link = (
             "index.html" in html
@@ -193,8 +170,7 @@ class TestBackToDashboardLink:
 
     def test_table_html_back_link_text(self) -> None:
         """table.html back link must contain 'dashboard' text."""
-        html = _read_static("table.html")
-        html_lower = html.lower()
+        html_lower = _read_static_lower("table.html")
         assert "dashboard" in html_lower, (
             "table.html back link text must mention 'dashboard'"
         )
@@ -202,7 +178,7 @@ class TestBackToDashboardLink:
     def test_create_html_has_back_link(self) -> None:
         """create.html must contain a link back to the dashboard."""
         html = _read_static("create.html")
-        html_lower = html.lower()
+        html_lower = _read_static_lower("create.html")
         has_back_link = (
             "index.html" in html
             or 'href="/admin"' in html_lower
@@ -214,8 +190,7 @@ class TestBackToDashboardLink:
 
     def test_create_html_back_link_text(self) -> None:
         """create.html back link must contain 'dashboard' text."""
-        html = _read_static("create.html")
-        html_lower = html.lower()
+        html_lower = _read_static_lower("create.html")
         assert "dashboard" in html_lower, (
             "create.html back link text must mention 'dashboard'"
         )
@@ -261,11 +236,11 @@ class TestTablePageH1Spacing:
         """
         h1_blocks = [
             body
-            for sel, body in _css_blocks(self.css)
+            for sel, body in css_blocks(self.css)
             if "h1" in sel
         ]
         has_half_rem = any(
-            _css_has_property(body, "margin-bottom", "0.5rem")
+            css_has_property(body, "margin-bottom", "0.5rem")
             for body in h1_blocks
         )
         assert has_half_rem, (
@@ -284,7 +259,7 @@ class TestExistingStylesPreserved:
     @pytest.fixture(autouse=True)
     def _load_css(self) -> None:
         self.css = _read_static("style.css")
-        self.css_lower = self.css.lower()
+        self.css_lower = _read_static_lower("style.css")
 
     def test_system_font_stack_preserved(self) -> None:
         """System font stack must still be present."""
@@ -332,28 +307,28 @@ class TestHtmlStructurePreserved:
     """Ensure HTML templates still have required elements after changes."""
 
     def test_table_html_still_has_table_element(self) -> None:
-        html = _read_static("table.html")
-        assert "<table" in html.lower()
+        html_lower = _read_static_lower("table.html")
+        assert "<table" in html_lower
 
     def test_table_html_still_has_add_record_btn(self) -> None:
         html = _read_static("table.html")
         assert "add-record-btn" in html or "Add Record" in html
 
     def test_table_html_still_has_loading_indicator(self) -> None:
-        html = _read_static("table.html")
-        assert "loading" in html.lower()
+        html_lower = _read_static_lower("table.html")
+        assert "loading" in html_lower
 
     def test_table_html_still_has_error_display(self) -> None:
-        html = _read_static("table.html")
-        assert "error" in html.lower()
+        html_lower = _read_static_lower("table.html")
+        assert "error" in html_lower
 
     def test_create_html_still_has_form(self) -> None:
-        html = _read_static("create.html")
-        assert "<form" in html.lower()
+        html_lower = _read_static_lower("create.html")
+        assert "<form" in html_lower
 
     def test_index_html_still_has_table_list(self) -> None:
         html = _read_static("index.html")
-        assert "table-list" in html or "<ul" in html.lower()
+        assert "table-list" in html or "<ul" in _read_static_lower("index.html")
 
     def test_create_html_still_links_style_css(self) -> None:
         html = _read_static("create.html")
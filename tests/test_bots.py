@@ -2,7 +2,19 @@
 
 from datetime import datetime, timezone
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.orm import Session
+
+from jm_api.models.bot import Bot
+
+# Fixed timestamps for deterministic date filter tests
+PAST = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+CUTOFF = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+RECENT = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+RANGE_END = datetime(2024, 9, 1, 12, 0, 0, tzinfo=timezone.utc)
+LATE = datetime(2024, 12, 1, 12, 0, 0, tzinfo=timezone.utc)
 
 
 # --- List Endpoint Tests ---
@@ -29,137 +41,277 @@ class TestListBotsEmpty:
 class TestListBotsPagination:
     """Test pagination behavior."""
 
-    def test_list_bots_paginated_page_1(
-        self, client: TestClient, bot_factory
+    def test_list_bots_per_page_over_max_rejected(
+        self, client: TestClient
     ) -> None:
-        """Page 1 of 25 bots returns 20 items with correct metadata."""
+        """per_page exceeding 100 returns 422 validation error."""
+        # Act
+        response = client.get("/api/v1/bots", params={"per_page": 101})
+
+        # Assert - reject with 422, don't silently cap
+        assert response.status_code == 422
+
+    def test_list_bots_per_page_zero_invalid(self, client: TestClient) -> None:
+        """per_page=0 returns 422 validation error."""
+        # Act
+        response = client.get("/api/v1/bots", params={"per_page": 0})
+
+        # Assert
+        assert response.status_code == 422
+
+    def test_list_bots_page_zero_invalid(self, client: TestClient) -> None:
+        """page=0 returns 422 validation error."""
+        # Act
+        response = client.get("/api/v1/bots", params={"page": 0})
+
+        # Assert
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize(
+        ("total", "page", "per_page", "expected_items", "expected_pages"),
+        [
+            # Each case seeds only as many rows as its page shape needs
+            (5, 1, 2, 2, 3),  # first page, remainder on the last page
+            (5, 2, 2, 2, 3),
+            (5, 3, 2, 1, 3),  # partial last page
+            (4, 2, 2, 2, 2),  # exact division, full last page
+            (5, 1, 100, 5, 1),  # single page
+            (5, 2, 3, 2, 2),
+        ],
+    )
+    def test_pagination_metadata(
+        self,
+        client: TestClient,
+        bot_factory,
+        total: int,
+        page: int,
+        per_page: int,
+        expected_items: int,
+        expected_pages: int,
+    ) -> None:
+        """Page size, page count and item slice are derived from the total."""
         # Arrange
-        for i in range(25):
-            bot_factory(rig_id=f"rig-{i:03d}")
+        bot_factory.bulk(total)
 
         # Act
-        response = client.get("/api/v1/bots")
+        response = client.get("/api/v1/bots", params={"page": page, "per_page": per_page})
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data["items"]) == 20
-        assert data["total"] == 25
-        assert data["page"] == 1
-        assert data["per_page"] == 20
-        assert data["pages"] == 2
+        assert len(data["items"]) == expected_items
+        assert data["total"] == total
+        assert data["page"] == page
+        assert data["per_page"] == per_page
+        assert data["pages"] == expected_pages
 
-    def test_list_bots_paginated_page_2(
+    def test_page_beyond_last_page_returns_empty(
         self, client: TestClient, bot_factory
     ) -> None:
-        """Page 2 of 25 bots returns remaining 5 items."""
+        """Requesting page beyond total pages returns empty items with correct metadata."""
         # Arrange
-        for i in range(25):
-            bot_factory(rig_id=f"rig-{i:03d}")
+        bot_factory.bulk(3)
 
-        # Act
-        response = client.get("/api/v1/bots", params={"page": 2})
+        # Act - request page 999 when there's only 1 page
+        response = client.get("/api/v1/bots", params={"page": 999, "per_page": 20})
 
-        # Assert
+        # Assert - returns empty items but preserves total/pages info
         assert response.status_code == 200
         data = response.json()
-        assert len(data["items"]) == 5
-        assert data["total"] == 25
-        assert data["page"] == 2
-        assert data["pages"] == 2
+        assert data["items"] == []
+        assert data["total"] == 3
+        assert data["page"] == 999
+        assert data["pages"] == 1
 
-    def test_list_bots_per_page_over_max_rejected(
-        self, client: TestClient
+    def test_list_bots_total_comes_from_page_query(
+        self, client: TestClient, capture_statements, bot_factory
     ) -> None:
-        """per_page exceeding 100 returns 422 validation error."""
+        """Total is read from COUNT(*) OVER () without a separate COUNT query."""
+        # Arrange
+        bot_factory(rig_id="rig-001")
+
         # Act
-        response = client.get("/api/v1/bots", params={"per_page": 101})
+        with capture_statements() as captured:
+            response = client.get("/api/v1/bots")
 
-        # Assert - reject with 422, don't silently cap
-        assert response.status_code == 422
+        # Assert
+        assert response.json()["total"] == 1
+        selects = [statement for statement, _ in captured if statement.startswith("SELECT")]
+        assert len(selects) == 1
+        assert "over ()" in selects[0].lower()
+
+
+class TestListBotsCursorPagination:
+    """Test keyset pagination via next_cursor / cursor."""
+
+    def test_full_page_returns_next_cursor(
+        self, client: TestClient, bot_factory
+    ) -> None:
+        """A full page includes a next_cursor; the last short page does not."""
+        # Arrange
+        bot_factory.bulk(3)
 
-    def test_list_bots_per_page_zero_invalid(self, client: TestClient) -> None:
-        """per_page=0 returns 422 validation error."""
         # Act
-        response = client.get("/api/v1/bots", params={"per_page": 0})
+        full = client.get("/api/v1/bots", params={"per_page": 2}).json()
+        short = client.get("/api/v1/bots", params={"per_page": 5}).json()
 
         # Assert
-        assert response.status_code == 422
+        assert full["next_cursor"]
+        assert short["next_cursor"] is None
+
+    def test_last_full_page_has_no_next_cursor(
+        self, client: TestClient, bot_factory
+    ) -> None:
+        """When total is a multiple of per_page, the last (full) page has no cursor."""
+        # Arrange
+        bot_factory.bulk(4)
 
-    def test_list_bots_page_zero_invalid(self, client: TestClient) -> None:
-        """page=0 returns 422 validation error."""
         # Act
-        response = client.get("/api/v1/bots", params={"page": 0})
+        first = client.get("/api/v1/bots", params={"per_page": 2}).json()
+        last = client.get(
+            "/api/v1/bots", params={"per_page": 2, "cursor": first["next_cursor"]}
+        ).json()
 
         # Assert
-        assert response.status_code == 422
+        assert len(first["items"]) == 2
+        assert first["next_cursor"]
+        assert len(last["items"]) == 2
+        assert last["next_cursor"] is None
 
-    def test_pagination_pages_exact_division(
+    def test_cursor_walks_all_bots_in_order(
         self, client: TestClient, bot_factory
     ) -> None:
-        """40 bots with per_page=20 gives pages=2."""
+        """Following next_cursor visits every bot once, in default sort order."""
         # Arrange
-        for i in range(40):
-            bot_factory(rig_id=f"rig-{i:03d}")
+        bot_factory.bulk(5)
+        expected = [
+            item["id"]
+            for item in client.get("/api/v1/bots", params={"per_page": 100}).json()["items"]
+        ]
 
         # Act
-        response = client.get("/api/v1/bots", params={"per_page": 20})
+        seen: list[str] = []
+        params: dict = {"per_page": 2}
+        while True:
+            data = client.get("/api/v1/bots", params=params).json()
+            seen.extend(item["id"] for item in data["items"])
+            assert data["total"] == 5
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
 
         # Assert
-        data = response.json()
-        assert data["total"] == 40
-        assert data["pages"] == 2
+        assert seen == expected
 
-    def test_pagination_pages_with_remainder(
-        self, client: TestClient, bot_factory
+    def test_cursor_respects_filters(self, client: TestClient, bot_factory) -> None:
+        """Filters apply to cursor pages and to the total."""
+        # Arrange
+        for i in range(4):
+            bot_factory(rig_id="rig-a" if i % 2 else "rig-b")
+
+        # Act
+        first = client.get("/api/v1/bots", params={"rig_id": "rig-a", "per_page": 1}).json()
+        second = client.get(
+            "/api/v1/bots",
+            params={"rig_id": "rig-a", "per_page": 1, "cursor": first["next_cursor"]},
+        ).json()
+
+        # Assert
+        assert second["total"] == 2
+        assert [item["rig_id"] for item in second["items"]] == ["rig-a"]
+        assert second["items"][0]["id"] != first["items"][0]["id"]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            pytest.param("garbage!", id="not-base64"),
+            # ["2024-01-01T00:00:00",{"x":1}] — object can't be bound as the id
+            pytest.param("WyIyMDI0LTAxLTAxVDAwOjAwOjAwIix7IngiOjF9XQ", id="object-value"),
+            # ["2024-01-01T00:00:00+00:00",5] — int compared against the String id
+            pytest.param("WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiw1XQ", id="wrong-type"),
+        ],
+    )
+    def test_invalid_cursor_returns_422(self, client: TestClient, cursor: str) -> None:
+        """A malformed cursor is rejected."""
+        # Act
+        response = client.get("/api/v1/bots", params={"cursor": cursor})
+
+        # Assert
+        assert response.status_code == 422
+        assert response.json()["detail"]["message"] == "Invalid cursor"
+
+
+class TestListBotsTotalCache:
+    """Test caching of the unfiltered COUNT(*) behind data["total"]."""
+
+    @staticmethod
+    def _count_queries(capture_statements, client: TestClient, params: dict) -> int:
+        with capture_statements() as captured:
+            client.get("/api/v1/bots", params=params)
+        return sum("count(" in statement.lower() for statement, _ in captured)
+
+    def test_unfiltered_total_counted_once(
+        self, client: TestClient, capture_statements, bot_factory
     ) -> None:
-        """41 bots with per_page=20 gives pages=3."""
+        """Repeated unfiltered full pages reuse the cached total."""
         # Arrange
-        for i in range(41):
-            bot_factory(rig_id=f"rig-{i:03d}")
+        bot_factory.bulk(3)
 
         # Act
-        response = client.get("/api/v1/bots", params={"per_page": 20})
+        first = self._count_queries(capture_statements, client, {"per_page": 1})
+        second = self._count_queries(capture_statements, client, {"per_page": 1, "page": 2})
 
         # Assert
-        data = response.json()
-        assert data["total"] == 41
-        assert data["pages"] == 3
+        assert (first, second) == (1, 0)
 
-    def test_pagination_single_page(
-        self, client: TestClient, bot_factory
+    def test_filtered_total_not_cached(
+        self, client: TestClient, capture_statements, bot_factory
     ) -> None:
-        """10 bots with per_page=20 gives pages=1."""
+        """Filtered totals are always counted."""
         # Arrange
-        for i in range(10):
-            bot_factory(rig_id=f"rig-{i:03d}")
+        for _ in range(3):
+            bot_factory(rig_id="rig-001")
 
         # Act
-        response = client.get("/api/v1/bots", params={"per_page": 20})
+        counts = [
+            self._count_queries(capture_statements, client, {"per_page": 1, "rig_id": "rig-001"})
+            for _ in range(2)
+        ]
 
         # Assert
-        data = response.json()
-        assert data["total"] == 10
-        assert data["pages"] == 1
+        assert counts == [1, 1]
 
-    def test_page_beyond_last_page_returns_empty(
+    def test_create_and_delete_invalidate_total(
         self, client: TestClient, bot_factory
     ) -> None:
-        """Requesting page beyond total pages returns empty items with correct metadata."""
+        """Creating or deleting a bot is reflected in the next total."""
         # Arrange
-        for i in range(3):
-            bot_factory(rig_id=f"rig-{i:03d}")
+        bot_factory.bulk(2)
+        assert client.get("/api/v1/bots", params={"per_page": 1}).json()["total"] == 2
 
-        # Act - request page 999 when there's only 1 page
-        response = client.get("/api/v1/bots", params={"page": 999, "per_page": 20})
+        # Act / Assert
+        created = client.post("/api/v1/bots", json={"rig_id": "rig-new"}).json()
+        assert client.get("/api/v1/bots", params={"per_page": 1}).json()["total"] == 3
 
-        # Assert - returns empty items but preserves total/pages info
-        assert response.status_code == 200
-        data = response.json()
-        assert data["items"] == []
-        assert data["total"] == 3
-        assert data["page"] == 999
-        assert data["pages"] == 1
+        client.delete(f"/api/v1/bots/{created['id']}")
+        assert client.get("/api/v1/bots", params={"per_page": 1}).json()["total"] == 2
+
+    def test_commit_drops_total_cached_after_flush(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """A total re-cached between flush and commit is dropped on commit."""
+        from jm_api.api.generic.counts import get_cached_count, set_cached_count
+
+        # Arrange
+        db_session.add(Bot(rig_id="rig-new"))
+        db_session.flush()
+        set_cached_count(Bot, 0)
+
+        # Act
+        db_session.commit()
+
+        # Assert
+        assert get_cached_count(Bot, ttl=60) is None
 
 
 class TestListBotsFilters:
@@ -179,7 +331,7 @@ class TestListBotsFilters:
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 2
-        assert all(item["rig_id"] == "rig-001" for item in data["items"])
+        assert {item["rig_id"] for item in data["items"]} == {"rig-001"}
 
     def test_filter_by_kill_switch_true(
         self, client: TestClient, bot_factory
@@ -197,7 +349,7 @@ class TestListBotsFilters:
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 2
-        assert all(item["kill_switch"] is True for item in data["items"])
+        assert {item["kill_switch"] for item in data["items"]} == {True}
 
     def test_filter_by_kill_switch_false(
         self, client: TestClient, bot_factory
@@ -215,7 +367,7 @@ class TestListBotsFilters:
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 2
-        assert all(item["kill_switch"] is False for item in data["items"])
+        assert {item["kill_switch"] for item in data["items"]} == {False}
 
     def test_filter_by_log_search_case_insensitive(
         self, client: TestClient, bot_factory
@@ -268,6 +420,40 @@ class TestListBotsFilters:
         assert data["total"] == 0
 
 
+class TestListBotsStatementCache:
+    """Test that list queries reuse SQLAlchemy's compiled statement cache."""
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ({"rig_id": "rig-001"}, {"rig_id": "rig-002"}),
+            ({"kill_switch": "true", "rig_id": "a"}, {"kill_switch": "false", "rig_id": "b"}),
+            ({"log_search": "error"}, {"log_search": "100%"}),
+            ({"create_at_after": PAST.isoformat()}, {"create_at_after": RECENT.isoformat()}),
+            ({"page": 3}, {"page": 4}),
+        ],
+    )
+    def test_same_filter_shape_hits_compiled_cache(
+        self, client: TestClient, capture_statements, first: dict, second: dict
+    ) -> None:
+        """Only filter values differ, so the second request compiles no SQL."""
+        # Arrange
+        client.get("/api/v1/bots", params=first)
+
+        # Act
+        with capture_statements() as captured:
+            response = client.get("/api/v1/bots", params=second)
+
+        # Assert
+        assert response.status_code == 200
+        cache_hits = [
+            context.cache_hit is CacheStats.CACHE_HIT
+            for statement, context in captured
+            if statement.startswith("SELECT")
+        ]
+        assert cache_hits and all(cache_hits)
+
+
 class TestListBotsDateFilters:
     """Test date range filtering with explicit timestamps."""
 
@@ -275,17 +461,13 @@ class TestListBotsDateFilters:
         self, client: TestClient, bot_factory
     ) -> None:
         """Filter by create_at_after excludes bots created before cutoff."""
-        # Arrange - use explicit timestamps for deterministic testing
-        old_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        new_time = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
-        cutoff = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
-
-        bot_factory(rig_id="rig-old", create_at=old_time)
-        bot_factory(rig_id="rig-new", create_at=new_time)
+        # Arrange
+        bot_factory(rig_id="rig-old", create_at=PAST)
+        bot_factory(rig_id="rig-new", create_at=RECENT)
 
         # Act
         response = client.get(
-            "/api/v1/bots", params={"create_at_after": cutoff.isoformat()}
+            "/api/v1/bots", params={"create_at_after": CUTOFF.isoformat()}
         )
 
         # Assert - only new bot should be included
@@ -298,17 +480,13 @@ class TestListBotsDateFilters:
         self, client: TestClient, bot_factory
     ) -> None:
         """Filter by create_at_before excludes bots created after cutoff."""
-        # Arrange - use explicit timestamps
-        old_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        new_time = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
-        cutoff = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
-
-        bot_factory(rig_id="rig-old", create_at=old_time)
-        bot_factory(rig_id="rig-new", create_at=new_time)
+        # Arrange
+        bot_factory(rig_id="rig-old", create_at=PAST)
+        bot_factory(rig_id="rig-new", create_at=RECENT)
 
         # Act
         response = client.get(
-            "/api/v1/bots", params={"create_at_before": cutoff.isoformat()}
+            "/api/v1/bots", params={"create_at_before": CUTOFF.isoformat()}
         )
 
         # Assert - only old bot should be included
@@ -322,22 +500,16 @@ class TestListBotsDateFilters:
     ) -> None:
         """Filter by create_at range includes only bots within range."""
         # Arrange - three bots with distinct timestamps
-        early = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        middle = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
-        late = datetime(2024, 12, 1, 12, 0, 0, tzinfo=timezone.utc)
-
-        bot_factory(rig_id="rig-early", create_at=early)
-        bot_factory(rig_id="rig-middle", create_at=middle)
-        bot_factory(rig_id="rig-late", create_at=late)
+        bot_factory(rig_id="rig-early", create_at=PAST)
+        bot_factory(rig_id="rig-middle", create_at=RECENT)
+        bot_factory(rig_id="rig-late", create_at=LATE)
 
         # Act - filter for middle range
-        range_start = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
-        range_end = datetime(2024, 9, 1, 12, 0, 0, tzinfo=timezone.utc)
         response = client.get(
             "/api/v1/bots",
             params={
-                "create_at_after": range_start.isoformat(),
-                "create_at_before": range_end.isoformat(),
+                "create_at_after": CUTOFF.isoformat(),
+                "create_at_before": RANGE_END.isoformat(),
             },
         )
 
@@ -352,17 +524,13 @@ class TestListBotsDateFilters:
     ) -> None:
         """Filter by last_run_at_after returns only bots that ran after cutoff."""
         # Arrange
-        past = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        recent = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
-        cutoff = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
-
-        bot_factory(rig_id="rig-old-run", last_run_at=past)
-        bot_factory(rig_id="rig-new-run", last_run_at=recent)
+        bot_factory(rig_id="rig-old-run", last_run_at=PAST)
+        bot_factory(rig_id="rig-new-run", last_run_at=RECENT)
         bot_factory(rig_id="rig-no-run", last_run_at=None)
 
         # Act
         response = client.get(
-            "/api/v1/bots", params={"last_run_at_after": cutoff.isoformat()}
+            "/api/v1/bots", params={"last_run_at_after": CUTOFF.isoformat()}
         )
 
         # Assert - only recent run bot should be included
@@ -432,12 +600,11 @@ class TestGetBot:
     def test_get_bot_found(self, client: TestClient, bot_factory) -> None:
         """Get existing bot returns all fields."""
         # Arrange
-        run_time = datetime.now(timezone.utc)
         bot = bot_factory(
             rig_id="rig-001",
             kill_switch=True,
             last_run_log="Test log",
-            last_run_at=run_time,
+            last_run_at=RECENT,
         )
 
         # Act
@@ -450,7 +617,7 @@ class TestGetBot:
         assert data["rig_id"] == "rig-001"
         assert data["kill_switch"] is True
         assert data["last_run_log"] == "Test log"
-        assert data["last_run_at"] is not None
+        assert data["last_run_at"].startswith("2024-06-01T12:00:00")
         assert "create_at" in data
         assert "last_update_at" in data
 
@@ -565,11 +732,8 @@ class TestDeterministicOrdering:
         self, client: TestClient, bot_factory
     ) -> None:
         """Bots created at same time are ordered deterministically by id."""
-        # Arrange - create bots that may have identical create_at timestamps
-        bots = []
-        for i in range(5):
-            bot = bot_factory(rig_id=f"rig-{i:03d}")
-            bots.append(bot)
+        # Arrange - pin create_at so every bot ties on the primary sort key
+        bots = bot_factory.bulk(5, create_at=PAST)
 
         # Act - fetch twice
         response1 = client.get("/api/v1/bots")
@@ -580,41 +744,28 @@ class TestDeterministicOrdering:
         assert response2.status_code == 200
         ids1 = [item["id"] for item in response1.json()["items"]]
         ids2 = [item["id"] for item in response2.json()["items"]]
-        assert ids1 == ids2
+        assert ids1 == ids2 == sorted((bot.id for bot in bots), reverse=True)
 
 
 class TestBotIdValidation:
     """Test bot_id path parameter validation."""
 
-    def test_get_bot_invalid_id_too_short(self, client: TestClient) -> None:
-        """bot_id shorter than 32 characters returns 422."""
+    @pytest.mark.parametrize(
+        ("bot_id", "expected_status"),
+        [
+            pytest.param("abc123", 422, id="too-short"),
+            pytest.param("a" * 33, 422, id="too-long"),
+            pytest.param("abc-123-def-456-ghi-789-jkl-012", 422, id="non-alphanumeric"),
+            # Valid format but the bot doesn't exist: 404, not a 422 validation error
+            pytest.param("a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6", 404, id="valid-format-not-found"),
+        ],
+    )
+    def test_get_bot_id_validation(
+        self, client: TestClient, bot_id: str, expected_status: int
+    ) -> None:
+        """Only 32-char alphanumeric bot_ids pass path validation."""
         # Act
-        response = client.get("/api/v1/bots/abc123")
-
-        # Assert
-        assert response.status_code == 422
-
-    def test_get_bot_invalid_id_too_long(self, client: TestClient) -> None:
-        """bot_id longer than 32 characters returns 422."""
-        # Act - 33 character ID
-        long_id = "a" * 33
-        response = client.get(f"/api/v1/bots/{long_id}")
+        response = client.get(f"/api/v1/bots/{bot_id}")
 
         # Assert
-        assert response.status_code == 422
-
-    def test_get_bot_invalid_id_non_alphanumeric(self, client: TestClient) -> None:
-        """bot_id with non-alphanumeric characters returns 422."""
-        # Act - ID with special characters
-        response = client.get("/api/v1/bots/abc-123-def-456-ghi-789-jkl-012")
-
-        # Assert
-        assert response.status_code == 422
-
-    def test_get_bot_valid_id_format_not_found(self, client: TestClient) -> None:
-        """Valid 32-char alphanumeric bot_id that doesn't exist returns 404."""
-        # Act - valid format but bot doesn't exist
-        response = client.get("/api/v1/bots/a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6")
-
-        # Assert - should be 404 not found, not 422 validation error
-        assert response.status_code == 404
+        assert response.status_code == expected_status
@@ -1,9 +1,13 @@
 """Tests for application configuration."""
 
+from unittest.mock import patch
+
 import pytest
+from fastapi import FastAPI
 from pydantic import ValidationError
 
-from jm_api.core.config import Settings
+from jm_api.core.config import Settings, get_settings
+from jm_api.db.session import init_db
 
 
 class TestDatabaseUrlConfig:
@@ -69,3 +73,76 @@ class TestEnvironmentDefaults:
         """Debug defaults to False."""
         settings = Settings(database_url="sqlite:///:memory:")
         assert settings.debug is False
+
+
+class TestSettingsCaching:
+    """Test that the shared Settings instance is cached and read-only."""
+
+    def test_get_settings_returns_cached_instance(self) -> None:
+        """Repeated calls return the same parsed Settings object."""
+        assert get_settings() is get_settings()
+
+    def test_settings_are_frozen(self) -> None:
+        """The shared instance cannot be mutated by callers."""
+        settings = Settings(database_url="sqlite:///:memory:")
+        with pytest.raises(ValidationError, match="frozen"):
+            settings.debug = True
+
+
+class TestDatabasePoolConfig:
+    """Test connection pool settings passed to the engine."""
+
+    def test_pool_settings_passed_for_server_database(self) -> None:
+        """Non-SQLite URLs get the configured pool size and overflow."""
+        # Arrange
+        settings = Settings(
+            database_url="postgresql://localhost/mydb",
+            db_pool_size=20,
+            db_max_overflow=5,
+        )
+
+        # Act
+        with (
+            patch("jm_api.db.session.get_settings", return_value=settings),
+            patch("jm_api.db.session.create_engine") as create_engine,
+        ):
+            init_db(FastAPI())
+
+        # Assert
+        create_engine.assert_called_once_with(
+            "postgresql://localhost/mydb", pool_size=20, max_overflow=5
+        )
+
+    def test_pool_settings_not_passed_for_sqlite(self) -> None:
+        """SQLite keeps SQLAlchemy's default pool for its URL type."""
+        # Arrange
+        settings = Settings(database_url="sqlite:///:memory:")
+
+        # Act
+        with (
+            patch("jm_api.db.session.get_settings", return_value=settings),
+            patch("jm_api.db.session.create_engine") as create_engine,
+        ):
+            init_db(FastAPI())
+
+        # Assert
+        create_engine.assert_called_once_with("sqlite:///:memory:")
+
+    def test_pool_size_must_be_positive(self) -> None:
+        """A zero-sized pool is rejected."""
+        with pytest.raises(ValidationError, match="db_pool_size"):
+            Settings(database_url="sqlite:///:memory:", db_pool_size=0)
+
+
+class TestCountCacheConfig:
+    """Test the list total cache TTL setting."""
+
+    def test_count_cache_ttl_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """JM_API_COUNT_CACHE_TTL sets the TTL; 0 turns the cache off."""
+        monkeypatch.setenv("JM_API_COUNT_CACHE_TTL", "0")
+        assert Settings(database_url="sqlite:///:memory:").count_cache_ttl == 0
+
+    def test_count_cache_ttl_must_not_be_negative(self) -> None:
+        """A negative TTL is rejected."""
+        with pytest.raises(ValidationError, match="count_cache_ttl"):
+            Settings(database_url="sqlite:///:memory:", count_cache_ttl=-1)
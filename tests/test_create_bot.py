@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.exc import IntegrityError
 
@@ -72,6 +73,14 @@ class TestCreateBotSuccess:
         assert data["create_at"] is not None
         assert data["last_update_at"] is not None
 
+    def test_create_bot_does_not_refresh(self, client: TestClient) -> None:
+        """Response is built from the flushed instance without a refresh SELECT."""
+        with patch("jm_api.api.generic.router.Session.refresh") as refresh:
+            response = client.post("/api/v1/bots", json={"rig_id": "rig-no-refresh"})
+        assert response.status_code == 201
+        assert len(response.json()["id"]) == 32
+        refresh.assert_not_called()
+
 
 class TestCreateBotValidation:
     """Test POST /api/v1/bots validation errors."""
@@ -106,10 +115,21 @@ class TestCreateBotValidation:
 class TestCreateBotDatabaseErrors:
     """Test POST /api/v1/bots handles database errors gracefully."""
 
-    def test_db_integrity_error_returns_409(self, client: TestClient) -> None:
+    @pytest.fixture
+    def force_integrity_error(self):
+        """Make the handler's commit raise IntegrityError.
+
+        Patched through the router module, where the handler looks Session up.
+        """
+        error = IntegrityError("", {}, Exception("UNIQUE constraint"))
+        with patch("jm_api.api.generic.router.Session.commit", side_effect=error):
+            yield
+
+    def test_db_integrity_error_returns_409(
+        self, client: TestClient, force_integrity_error
+    ) -> None:
         """IntegrityError during commit returns 409 with useful message."""
-        with patch("jm_api.api.generic.router.Session.commit", side_effect=IntegrityError("", {}, Exception("UNIQUE constraint"))):
-            response = client.post("/api/v1/bots", json={"rig_id": "rig-err"})
+        response = client.post("/api/v1/bots", json={"rig_id": "rig-err"})
         assert response.status_code == 409
         data = response.json()
         assert "detail" in data
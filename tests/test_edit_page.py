@@ -11,8 +11,8 @@ XSS safety) are in test_edit_page_integration.py.
 
 import pathlib
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
@@ -24,6 +24,18 @@ def _read_static(filename: str) -> str:
     return path.read_text()
 
 
+@pytest.fixture(scope="module")
+def edit_html() -> str:
+    """edit.html contents, read once for the module."""
+    return _read_static("edit.html")
+
+
+@pytest.fixture(scope="module")
+def app_js() -> str:
+    """app.js contents, read once for the module."""
+    return _read_static("app.js")
+
+
 # ===================================================================
 # edit.html — file existence and serving
 # ===================================================================
@@ -36,11 +48,10 @@ class TestEditHtmlServing:
         """src/jm_api/static/edit.html must exist."""
         assert (STATIC_DIR / "edit.html").exists()
 
-    def test_edit_html_served(self, client: TestClient) -> None:
+    def test_edit_html_served(self, edit_html_response: httpx.Response) -> None:
         """GET /admin/edit.html returns 200 with HTML content."""
-        response = client.get("/admin/edit.html")
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        assert edit_html_response.status_code == 200
+        assert "text/html" in edit_html_response.headers["content-type"]
 
 
 # ===================================================================
@@ -51,41 +62,37 @@ class TestEditHtmlServing:
 class TestEditHtmlContent:
     """Verify edit.html meets spec requirements."""
 
-    @pytest.fixture(autouse=True)
-    def _load_html(self) -> None:
-        self.html = _read_static("edit.html")
-        self.html_lower = self.html.lower()
-
-    def test_has_valid_html_structure(self) -> None:
+    def test_has_valid_html_structure(self, edit_html: str) -> None:
         """edit.html must have basic HTML document structure."""
-        assert "<!doctype html>" in self.html_lower or "<!DOCTYPE html>" in self.html
-        assert "<html" in self.html_lower
-        assert "<head" in self.html_lower
-        assert "<body" in self.html_lower
+        html_lower = edit_html.lower()
+        assert "<!doctype html>" in html_lower
+        assert "<html" in html_lower
+        assert "<head" in html_lower
+        assert "<body" in html_lower
 
-    def test_has_edit_form(self) -> None:
+    def test_has_edit_form(self, edit_html: str) -> None:
         """edit.html must have a form with id='edit-form'."""
-        assert 'id="edit-form"' in self.html
+        assert 'id="edit-form"' in edit_html
 
-    def test_has_back_to_table_link(self) -> None:
+    def test_has_back_to_table_link(self, edit_html: str) -> None:
         """edit.html must have a 'Back to table' link."""
-        assert "table.html" in self.html
+        assert "table.html" in edit_html
 
-    def test_has_error_display(self) -> None:
+    def test_has_error_display(self, edit_html: str) -> None:
         """edit.html must have an error display div."""
-        assert 'id="error"' in self.html
+        assert 'id="error"' in edit_html
 
-    def test_has_title_element(self) -> None:
+    def test_has_title_element(self, edit_html: str) -> None:
         """edit.html must have an editable title element."""
-        assert 'id="edit-title"' in self.html
+        assert 'id="edit-title"' in edit_html
 
-    def test_links_style_css(self) -> None:
+    def test_links_style_css(self, edit_html: str) -> None:
         """edit.html must link to style.css."""
-        assert "style.css" in self.html
+        assert "style.css" in edit_html
 
-    def test_links_app_js(self) -> None:
+    def test_links_app_js(self, edit_html: str) -> None:
         """edit.html must include app.js."""
-        assert "app.js" in self.html
+        assert "app.js" in edit_html
 
 
 # ===================================================================
@@ -96,14 +103,10 @@ class TestEditHtmlContent:
 class TestAppJsTableRowLinks:
     """Verify table rows link the ID column to the edit page."""
 
-    @pytest.fixture(autouse=True)
-    def _load_js(self) -> None:
-        self.js = _read_static("app.js")
-
-    def test_renders_edit_links_in_table(self) -> None:
+    def test_renders_edit_links_in_table(self, app_js: str) -> None:
         """app.js renderTable must create links to edit.html in the ID column."""
-        assert "edit.html" in self.js
+        assert "edit.html" in app_js
 
-    def test_id_column_is_clickable(self) -> None:
+    def test_id_column_is_clickable(self, app_js: str) -> None:
         """The first column (id) must render as an <a> link."""
-        assert "<a " in self.js or "<a>" in self.js
+        assert "<a " in app_js or "<a>" in app_js
@@ -14,18 +14,51 @@ from __future__ import annotations
 
 import pathlib
 import re
+from bisect import bisect_right
+from functools import lru_cache
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
+_STATIC_PATHS = {path.name: path for path in STATIC_DIR.iterdir() if path.is_file()}
+
+# Patterns used across tests, compiled once
+_DCL_RE = re.compile(r'addEventListener\s*\(\s*["\']DOMContentLoaded["\']')
+_EDIT_FORM_RE = re.compile(r'getElementById\s*\(\s*["\']edit-form["\']\s*\)')
+_CREATE_FORM_RE = re.compile(r'getElementById\s*\(\s*["\']create-form["\']\s*\)')
+_GET_TABLE_PARAM_RE = re.compile(r"get\s*\(\s*[\"']table[\"']\s*\)")
+_GET_ID_PARAM_RE = re.compile(r"get\s*\(\s*[\"']id[\"']\s*\)")
+_OPENAPI_URL_RE = re.compile(r"[\"'`]/openapi\.json[\"'`]")
+_RENDER_EDIT_FORM_CALL_RE = re.compile(r"renderEditForm\s*\(")
+_PUT_METHOD_RE = re.compile(r"method\s*:\s*[\"']PUT[\"']")
+_JSON_CONTENT_TYPE_RE = re.compile(
+    r"[\"']Content-Type[\"']\s*:\s*[\"']application/json[\"']"
+)
+_EDIT_FORM_LOOKUPS = ('getElementById("edit-form")', "getElementById('edit-form')")
+
+
+@lru_cache(maxsize=8)
+def _read_static(filename: str) -> str:
+    """Read a static file's text content from disk, once per filename."""
+    path = _STATIC_PATHS.get(filename)
+    assert path is not None, f"Expected static file not found: {STATIC_DIR / filename}"
+    return path.read_bytes().decode("utf-8")
 
 
-def _read_static(filename: str) -> str:
-    """Read a static file's text content from disk."""
-    path = STATIC_DIR / filename
-    assert path.exists(), f"Expected static file not found: {path}"
-    return path.read_text()
+@lru_cache(maxsize=8)
+def _read_static_lines(filename: str) -> tuple[str, ...]:
+    """A static file's lines with leading whitespace stripped, split once per filename."""
+    return tuple(line.lstrip() for line in _read_static(filename).splitlines())
+
+
+@lru_cache(maxsize=4)
+def _brace_positions(js: str) -> tuple[list[int], list[int]]:
+    """Return the sorted positions of every brace in js and their depth deltas."""
+    positions = [i for i, c in enumerate(js) if c in "{}"]
+    deltas = [1 if js[i] == "{" else -1 for i in positions]
+    return positions, deltas
 
 
 def _walk_braces(js: str, open_pos: int) -> str:
@@ -33,35 +66,68 @@ def _walk_braces(js: str, open_pos: int) -> str:
 
     Returns the text *between* the braces (exclusive).
     """
+    positions, deltas = _brace_positions(js)
     depth = 1
-    pos = open_pos + 1
-    while pos < len(js) and depth > 0:
-        if js[pos] == "{":
-            depth += 1
-        elif js[pos] == "}":
-            depth -= 1
-        pos += 1
-    return js[open_pos + 1 : pos - 1]
+    end = len(js)
+    for k in range(bisect_right(positions, open_pos), len(positions)):
+        depth += deltas[k]
+        if depth == 0:
+            end = positions[k] + 1
+            break
+    return js[open_pos + 1 : end - 1]
 
 
+@lru_cache(maxsize=32)
 def _extract_function_body(js: str, fn_name: str) -> str | None:
-    """Extract the full body of a named JS function using brace-walking."""
+    """Extract the full body of a named JS function using brace-walking.
+
+    Cached, so each body is walked once per session for the shared app.js text.
+    """
     m = re.search(rf"function\s+{fn_name}\s*\([^)]*\)\s*\{{", js)
     if not m:
         return None
     return _walk_braces(js, m.end() - 1)
 
 
+@lru_cache(maxsize=8)
 def _extract_dcl_handler_body(js: str) -> str:
-    """Extract the DOMContentLoaded callback body using brace-walking."""
-    dcl_match = re.search(
-        r'addEventListener\s*\(\s*["\']DOMContentLoaded["\']', js,
-    )
+    """Extract the DOMContentLoaded callback body using brace-walking (cached)."""
+    dcl_match = _DCL_RE.search(js)
     assert dcl_match, "DOMContentLoaded handler not found in app.js"
     brace_pos = js.index("{", dcl_match.start())
     return _walk_braces(js, brace_pos)
 
 
+def _strip_js_comments(js: str) -> str:
+    """Remove // line comments and /* */ block comments in one forward pass.
+
+    Line comments keep their terminating newline; an unterminated block
+    comment is left in place.
+    """
+    parts = []
+    pos = 0
+    while True:
+        line = js.find("//", pos)
+        block = js.find("/*", pos)
+        if line == -1 and block == -1:
+            parts.append(js[pos:])
+            break
+        if block == -1 or (line != -1 and line < block):
+            parts.append(js[pos:line])
+            end = js.find("\n", line)
+            if end == -1:
+                break
+            pos = end
+        else:
+            parts.append(js[pos:block])
+            end = js.find("*/", block + 2)
+            if end == -1:
+                parts.append(js[block:])
+                break
+            pos = end + 2
+    return "".join(parts)
+
+
 # ===================================================================
 # Fix 1: No duplicate initEditPage() — empty placeholder must be gone
 # ===================================================================
@@ -82,9 +148,11 @@ class TestNoDuplicateInitEditPage:
     def test_exactly_one_init_edit_page_declaration(self) -> None:
         """app.js must contain exactly ONE initEditPage function declaration."""
         # Match 'function initEditPage' at the start of a line (top-level declarations)
-        declarations = re.findall(r"^\s*function\s+initEditPage\s*\(", self.js, re.MULTILINE)
-        assert len(declarations) == 1, (
-            f"Expected exactly 1 initEditPage declaration, found {len(declarations)}. "
+        declarations = sum(
+            1 for line in _read_static_lines("app.js") if line.startswith("function initEditPage(")
+        )
+        assert declarations == 1, (
+            f"Expected exactly 1 initEditPage declaration, found {declarations}. "
             "The empty placeholder must be deleted."
         )
 
@@ -97,11 +165,7 @@ class TestNoDuplicateInitEditPage:
         # Use brace-walking to extract the full function body (handles nested braces)
         body = _extract_function_body(self.js, "initEditPage")
         assert body is not None, "initEditPage function not found"
-        stripped = body.strip()
-        # Remove single-line comments
-        stripped = re.sub(r"//.*", "", stripped).strip()
-        # Remove multi-line comments
-        stripped = re.sub(r"/\*.*?\*/", "", stripped, flags=re.DOTALL).strip()
+        stripped = _strip_js_comments(body).strip()
         assert stripped != "", (
             "Found an empty initEditPage placeholder (body has only comments/whitespace). "
             "This must be deleted — it overwrites the full implementation via hoisting."
@@ -146,12 +210,10 @@ class TestNoDuplicateEditFormBranch:
         """The DOMContentLoaded handler must check for 'edit-form' exactly once."""
         handler_body = _extract_dcl_handler_body(self.js)
 
-        edit_form_checks = re.findall(
-            r'getElementById\s*\(\s*["\']edit-form["\']\s*\)', handler_body
-        )
-        assert len(edit_form_checks) == 1, (
+        edit_form_checks = sum(handler_body.count(lookup) for lookup in _EDIT_FORM_LOOKUPS)
+        assert edit_form_checks == 1, (
             f"Expected exactly 1 edit-form check in DOMContentLoaded, "
-            f"found {len(edit_form_checks)}. The duplicate else-if block "
+            f"found {edit_form_checks}. The duplicate else-if block "
             "is dead code and must be removed."
         )
 
@@ -159,10 +221,10 @@ class TestNoDuplicateEditFormBranch:
         """initEditPage() must appear exactly once in the DOMContentLoaded handler."""
         handler_body = _extract_dcl_handler_body(self.js)
 
-        calls = re.findall(r"initEditPage\s*\(\s*\)", handler_body)
-        assert len(calls) == 1, (
+        calls = handler_body.count("initEditPage()")
+        assert calls == 1, (
             f"Expected exactly 1 initEditPage() call in DOMContentLoaded, "
-            f"found {len(calls)}."
+            f"found {calls}."
         )
 
     def test_no_unreachable_else_if_after_create_form(self) -> None:
@@ -174,14 +236,8 @@ class TestNoDuplicateEditFormBranch:
         handler_body = _extract_dcl_handler_body(self.js)
 
         # Find positions of create-form and edit-form checks
-        create_positions = [
-            m.start()
-            for m in re.finditer(r'getElementById\s*\(\s*["\']create-form["\']\s*\)', handler_body)
-        ]
-        edit_positions = [
-            m.start()
-            for m in re.finditer(r'getElementById\s*\(\s*["\']edit-form["\']\s*\)', handler_body)
-        ]
+        create_positions = [m.start() for m in _CREATE_FORM_RE.finditer(handler_body)]
+        edit_positions = [m.start() for m in _EDIT_FORM_RE.finditer(handler_body)]
 
         if create_positions and edit_positions:
             # No edit-form check should appear AFTER the create-form check
@@ -220,17 +276,17 @@ class TestEditPageFunctionality:
         """initEditPage must parse table and id from URL search params."""
         assert self.edit_body is not None, "initEditPage not found"
         assert "URLSearchParams" in self.edit_body
-        assert re.search(r"get\s*\(\s*[\"']table[\"']\s*\)", self.edit_body), (
+        assert _GET_TABLE_PARAM_RE.search(self.edit_body), (
             "initEditPage must read 'table' from URL search params"
         )
-        assert re.search(r"get\s*\(\s*[\"']id[\"']\s*\)", self.edit_body), (
+        assert _GET_ID_PARAM_RE.search(self.edit_body), (
             "initEditPage must read 'id' from URL search params"
         )
 
     def test_init_edit_page_fetches_record(self) -> None:
         """initEditPage must fetch the individual record via /api/v1/{table}/{id}."""
         assert self.edit_body is not None, "initEditPage not found"
-        assert re.search(r"/api/v1/", self.edit_body), (
+        assert "/api/v1/" in self.edit_body, (
             "initEditPage must fetch the record at /api/v1/{table}/{id}"
         )
         assert "fetch" in self.edit_body, (
@@ -240,31 +296,30 @@ class TestEditPageFunctionality:
     def test_init_edit_page_fetches_openapi_schema(self) -> None:
         """initEditPage must fetch /openapi.json to discover editable fields."""
         assert self.edit_body is not None, "initEditPage not found"
-        assert re.search(r"[\"'`]/openapi\.json[\"'`]", self.edit_body), (
+        assert _OPENAPI_URL_RE.search(self.edit_body), (
             "initEditPage must fetch OpenAPI schema to discover form fields"
         )
 
     def test_init_edit_page_calls_render_edit_form(self) -> None:
         """initEditPage must call renderEditForm to build the edit form."""
         assert self.edit_body is not None, "initEditPage not found"
-        assert re.search(r"renderEditForm\s*\(", self.edit_body), (
+        assert _RENDER_EDIT_FORM_CALL_RE.search(self.edit_body), (
             "initEditPage must call renderEditForm to populate the edit form"
         )
 
     def test_submit_edit_form_uses_put(self) -> None:
         """submitEditForm must send a PUT request to update the record."""
         assert self.submit_body is not None, "submitEditForm not found"
-        assert re.search(r"method\s*:\s*[\"']PUT[\"']", self.submit_body), (
+        assert _PUT_METHOD_RE.search(self.submit_body), (
             "submitEditForm must use HTTP PUT method to update the record"
         )
 
     def test_submit_edit_form_sends_json(self) -> None:
         """submitEditForm must send JSON body with Content-Type header."""
         assert self.submit_body is not None, "submitEditForm not found"
-        assert re.search(
-            r"[\"']Content-Type[\"']\s*:\s*[\"']application/json[\"']",
-            self.submit_body,
-        ), "submitEditForm must set Content-Type: application/json header"
+        assert _JSON_CONTENT_TYPE_RE.search(self.submit_body), (
+            "submitEditForm must set Content-Type: application/json header"
+        )
 
     def test_submit_edit_form_redirects_on_success(self) -> None:
         """submitEditForm must redirect to table page on success."""
@@ -300,58 +355,46 @@ class TestEditApiRoundTrip:
         data = resp.json()
         assert data["rig_id"] == "rig-get-test"
 
-    def test_put_updates_bot(self, client: TestClient, bot_factory) -> None:
-        """PUT /api/v1/bots/{id} must update and return the updated record."""
+    def test_put_updates_bot_then_get_is_consistent(
+        self, client: TestClient, bot_factory
+    ) -> None:
+        """PUT /api/v1/bots/{id} must return the updated record, and GET must agree."""
         bot = bot_factory(rig_id="rig-put-test", kill_switch=False)
-        resp = client.put(
-            f"/api/v1/bots/{bot.id}",
-            json={"rig_id": "rig-updated", "kill_switch": True},
-        )
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["rig_id"] == "rig-updated"
-        assert data["kill_switch"] is True
-
-    def test_put_then_get_consistency(self, client: TestClient, bot_factory) -> None:
-        """PUT followed by GET must return consistent data."""
-        bot = bot_factory(rig_id="rig-consistency")
         put_resp = client.put(
             f"/api/v1/bots/{bot.id}",
-            json={"rig_id": "rig-after-edit"},
+            json={"rig_id": "rig-updated", "kill_switch": True},
         )
         assert put_resp.status_code == 200, (
             f"PUT failed with status {put_resp.status_code}: {put_resp.text}"
         )
+        data = put_resp.json()
+        assert data["rig_id"] == "rig-updated"
+        assert data["kill_switch"] is True
+
         get_resp = client.get(f"/api/v1/bots/{bot.id}")
         assert get_resp.status_code == 200
-        assert get_resp.json()["rig_id"] == "rig-after-edit"
+        assert get_resp.json() == data
 
-    def test_openapi_schema_available(self, client: TestClient) -> None:
+    def test_openapi_schema_available(self, openapi_schema: dict) -> None:
         """GET /openapi.json must be available (needed by initEditPage)."""
-        resp = client.get("/openapi.json")
-        assert resp.status_code == 200
-        spec = resp.json()
-        assert "paths" in spec
-        assert "/api/v1/bots" in spec["paths"]
+        assert "paths" in openapi_schema
+        assert "/api/v1/bots" in openapi_schema["paths"]
 
-    def test_openapi_has_post_schema_for_field_discovery(self, client: TestClient) -> None:
+    def test_openapi_has_post_schema_for_field_discovery(self, openapi_schema: dict) -> None:
         """OpenAPI spec must have a POST schema for bots with requestBody.
 
         initEditPage uses discoverCreateFields which reads the POST schema.
         """
-        resp = client.get("/openapi.json")
-        spec = resp.json()
-        bots_path = spec["paths"].get("/api/v1/bots", {})
+        bots_path = openapi_schema["paths"].get("/api/v1/bots", {})
         assert "post" in bots_path, "POST endpoint must exist for field discovery"
         assert "requestBody" in bots_path["post"], (
             "POST schema must have requestBody for discoverCreateFields"
         )
 
-    def test_edit_html_served(self, client: TestClient) -> None:
+    def test_edit_html_served(self, edit_html_response: httpx.Response) -> None:
         """GET /admin/edit.html must return 200 with HTML content."""
-        resp = client.get("/admin/edit.html")
-        assert resp.status_code == 200
-        assert "text/html" in resp.headers["content-type"]
+        assert edit_html_response.status_code == 200
+        assert "text/html" in edit_html_response.headers["content-type"]
 
 
 # ===================================================================
@@ -9,18 +9,34 @@ Covers:
 from __future__ import annotations
 
 import pathlib
+import re
+from functools import lru_cache
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
 
+@lru_cache(maxsize=8)
 def _read_static(filename: str) -> str:
     path = STATIC_DIR / filename
     assert path.exists(), f"Expected static file not found: {path}"
     return path.read_text()
 
 
+_TOP_LEVEL_FUNCTION_RE = re.compile(r"^function (\w+)", re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _js_function_sources(js: str) -> dict[str, str]:
+    """Map each top-level function name to its source, up to the next top-level function."""
+    matches = list(_TOP_LEVEL_FUNCTION_RE.finditer(js))
+    ends = [m.start() - 1 for m in matches[1:]] + [len(js)]
+    return {m.group(1): js[m.start() : end] for m, end in zip(matches, ends)}
+
+
 # ===================================================================
 # Issue 3: XSS fix — renderEditForm must use safe DOM APIs
 # ===================================================================
@@ -29,37 +45,27 @@ def _read_static(filename: str) -> str:
 class TestRenderEditFormXssSafety:
     """renderEditForm must use DOM APIs instead of string interpolation."""
 
+    @pytest.fixture(autouse=True)
+    def _load_js(self) -> None:
+        self.edit_form_body = _js_function_sources(_read_static("app.js"))["renderEditForm"]
+
     def test_render_edit_form_uses_create_element(self) -> None:
         """renderEditForm must use document.createElement for safe DOM construction."""
-        js = _read_static("app.js")
-        # Extract the renderEditForm function body
-        start = js.index("function renderEditForm")
-        # Find the next top-level function (starts at column 0)
-        next_fn = js.index("\nfunction ", start + 1)
-        edit_form_body = js[start:next_fn]
-        assert "createElement" in edit_form_body, (
+        assert "createElement" in self.edit_form_body, (
             "renderEditForm should use document.createElement for XSS safety"
         )
 
     def test_render_edit_form_uses_set_attribute(self) -> None:
         """renderEditForm must use setAttribute for setting input values safely."""
-        js = _read_static("app.js")
-        start = js.index("function renderEditForm")
-        next_fn = js.index("\nfunction ", start + 1)
-        edit_form_body = js[start:next_fn]
         # Should use setAttribute or .value = for safe value assignment
-        assert "setAttribute" in edit_form_body or ".value" in edit_form_body, (
+        assert "setAttribute" in self.edit_form_body or ".value" in self.edit_form_body, (
             "renderEditForm should use setAttribute or .value for safe value setting"
         )
 
     def test_render_edit_form_no_inner_html_with_values(self) -> None:
         """renderEditForm must not use innerHTML with record values (XSS risk)."""
-        js = _read_static("app.js")
-        start = js.index("function renderEditForm")
-        next_fn = js.index("\nfunction ", start + 1)
-        edit_form_body = js[start:next_fn]
         # Should not have the pattern: value="' + displayVal + '"
-        assert 'value="' not in edit_form_body, (
+        assert 'value="' not in self.edit_form_body, (
             "renderEditForm should not interpolate values into HTML attribute strings"
         )
 
@@ -151,8 +157,7 @@ class TestEditRoundTrip:
         get_resp = client.get(f"/api/v1/bots/{bot.id}")
         assert get_resp.json()["last_run_log"] is None
 
-    def test_edit_page_served(self, client: TestClient) -> None:
+    def test_edit_page_served(self, edit_html_response: httpx.Response) -> None:
         """GET /admin/edit.html returns 200 with HTML."""
-        resp = client.get("/admin/edit.html")
-        assert resp.status_code == 200
-        assert "text/html" in resp.headers["content-type"]
+        assert edit_html_response.status_code == 200
+        assert "text/html" in edit_html_response.headers["content-type"]
@@ -0,0 +1,66 @@
+"""Tests for ETag / If-None-Match handling on GET responses."""
+
+from fastapi.testclient import TestClient
+
+
+class TestETag:
+    """Test ETag generation and conditional GET."""
+
+    def test_get_list_sets_etag(self, client: TestClient) -> None:
+        """Successful GET responses carry an ETag header."""
+        response = client.get("/api/v1/bots")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+
+    def test_matching_if_none_match_returns_304(
+        self, client: TestClient, bot_factory
+    ) -> None:
+        """Unchanged resource with matching If-None-Match returns empty 304."""
+        bot = bot_factory(rig_id="rig-001")
+        first = client.get(f"/api/v1/bots/{bot.id}")
+        etag = first.headers["etag"]
+
+        response = client.get(f"/api/v1/bots/{bot.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert "x-request-id" in response.headers
+
+    def test_weak_and_listed_etags_match(self, client: TestClient) -> None:
+        """Weak validators and comma-separated lists are honoured."""
+        etag = client.get("/api/v1/bots").headers["etag"]
+
+        response = client.get(
+            "/api/v1/bots", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+    def test_changed_resource_returns_new_etag(
+        self, client: TestClient, bot_factory
+    ) -> None:
+        """A stale ETag gets a full 200 response with a new ETag."""
+        etag = client.get("/api/v1/bots").headers["etag"]
+        bot_factory(rig_id="rig-001")
+
+        response = client.get("/api/v1/bots", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert response.headers["etag"] != etag
+
+    def test_error_responses_have_no_etag(self, client: TestClient) -> None:
+        """Non-2xx responses are passed through untouched."""
+        response = client.get("/api/v1/bots/aaaabbbbccccddddeeeeffffgggghhhh")
+
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+    def test_post_has_no_etag(self, client: TestClient) -> None:
+        """Only GET responses are tagged."""
+        response = client.post("/api/v1/bots", json={"rig_id": "rig-001"})
+
+        assert response.status_code == 201
+        assert "etag" not in response.headers
@@ -17,15 +17,25 @@ Plus acceptance criteria:
 
 import pathlib
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from html.parser import HTMLParser
 
 import pytest
 
+from css_helpers import css_has_property, find_blocks
+
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
+# Patterns used by helpers and assertions, compiled once
+_FUNCTION_NAME_RE = re.compile(r"^function\s+(\w+)\s*\(", re.MULTILINE)
+_PAGE_RESET_RE = re.compile(r'append\(\s*"page"\s*,\s*"1"\s*\)')
+_SORT_DIRECTION_ASSIGN_RE = re.compile(r"TableState\.sortDirection\s*=[^=]")
+
 
+@lru_cache(maxsize=8)
 def _read_static(filename: str) -> str:
-    """Read a static file's text content from disk."""
+    """Read a static file's text content from disk, once per filename."""
     path = STATIC_DIR / filename
     assert path.exists(), f"Expected static file not found: {path}"
     return path.read_text()
@@ -36,6 +46,15 @@ def _read_static(filename: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4)
+def _brace_positions(js: str) -> tuple[list[int], list[int]]:
+    """Return the sorted positions of every brace in *js* and their depth deltas."""
+    positions = [i for i, c in enumerate(js) if c in "{}"]
+    deltas = [1 if js[i] == "{" else -1 for i in positions]
+    return positions, deltas
+
+
+@lru_cache(maxsize=64)
 def _extract_js_function_body(js: str, name: str) -> str | None:
     """Extract the full body of a named JS function using brace-counting.
 
@@ -47,49 +66,19 @@ def _extract_js_function_body(js: str, name: str) -> str | None:
     if not match:
         return None
     start = match.start()
+    positions, deltas = _brace_positions(js)
     depth = 0
-    i = match.end() - 1  # position of the opening brace
-    while i < len(js):
-        if js[i] == "{":
-            depth += 1
-        elif js[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return js[start : i + 1]
-        i += 1
+    # Walk only the braces, starting at the function's opening brace
+    for k in range(bisect_left(positions, match.end() - 1), len(positions)):
+        depth += deltas[k]
+        if depth == 0:
+            return js[start : positions[k] + 1]
     return None
 
 
 def _js_function_names(js: str) -> list[str]:
     """Return all top-level ``function xyz(`` names found in *js*."""
-    return re.findall(r"^function\s+(\w+)\s*\(", js, flags=re.MULTILINE)
-
-
-# ---------------------------------------------------------------------------
-# CSS helpers (reused from test_table_enhancements pattern)
-# ---------------------------------------------------------------------------
-
-
-def _css_blocks(css: str) -> list[tuple[str, str]]:
-    """Return list of (selector, body) tuples from CSS text."""
-    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
-    blocks: list[tuple[str, str]] = []
-    for match in re.finditer(r"([^{}]+)\{([^}]*)\}", css):
-        selector = match.group(1).strip()
-        body = match.group(2).strip()
-        blocks.append((selector, body))
-    return blocks
-
-
-def _find_blocks(css: str, selector_pattern: str) -> list[str]:
-    """Return CSS bodies for all selectors matching *selector_pattern* (substring)."""
-    return [body for sel, body in _css_blocks(css) if selector_pattern in sel]
-
-
-def _css_has_property(body: str, prop: str, value: str) -> bool:
-    """Check if a CSS body string contains ``prop: value``."""
-    pattern = rf"{re.escape(prop)}\s*:\s*{re.escape(value)}"
-    return bool(re.search(pattern, body))
+    return _FUNCTION_NAME_RE.findall(js)
 
 
 # ---------------------------------------------------------------------------
@@ -98,20 +87,46 @@ def _css_has_property(body: str, prop: str, value: str) -> bool:
 
 
 class _TagCollector(HTMLParser):
-    """Collects (tag, attrs-dict) tuples in document order."""
+    """Collects (tag, attrs-dict) tuples in document order.
+
+    Also records the first <summary> text of each <details>, keyed by the
+    details element's id.
+    """
 
     def __init__(self) -> None:
         super().__init__()
         self.tags: list[tuple[str, dict[str, str | None]]] = []
+        self.summaries: dict[str | None, str] = {}
+        self._details_ids: list[str | None] = []
+        self._summary_text: list[str] | None = None
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        self.tags.append((tag, dict(attrs)))
-
-
-def _parse_html_tags(html: str) -> list[tuple[str, dict[str, str | None]]]:
+        attrs_dict = dict(attrs)
+        self.tags.append((tag, attrs_dict))
+        if tag == "details":
+            self._details_ids.append(attrs_dict.get("id"))
+        elif tag == "summary" and self._details_ids:
+            self._summary_text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "details" and self._details_ids:
+            self._details_ids.pop()
+        elif tag == "summary" and self._summary_text is not None:
+            self.summaries.setdefault(self._details_ids[-1], "".join(self._summary_text))
+            self._summary_text = None
+
+    def handle_data(self, data: str) -> None:
+        if self._summary_text is not None:
+            self._summary_text.append(data)
+
+
+@lru_cache(maxsize=4)
+def _parse_html(html: str) -> _TagCollector:
+    """Parse *html* once; callers must treat the result as read-only."""
     collector = _TagCollector()
     collector.feed(html)
-    return collector.tags
+    collector.close()
+    return collector
 
 
 # ===================================================================
@@ -212,7 +227,9 @@ class TestFilterPanelHTML:
     @pytest.fixture(autouse=True)
     def _load_html(self) -> None:
         self.html = _read_static("table.html")
-        self.tags = _parse_html_tags(self.html)
+        parsed = _parse_html(self.html)
+        self.tags = parsed.tags
+        self.summaries = parsed.summaries
 
     def test_filter_details_element_exists(self) -> None:
         """A <details id='filter-toggle'> element must exist in table.html."""
@@ -225,16 +242,11 @@ class TestFilterPanelHTML:
 
     def test_filter_details_has_summary(self) -> None:
         """The filter <details> must contain a <summary> with 'Filters' text."""
-        # Find the summary text inside the filter details block
-        summary_match = re.search(
-            r'<details[^>]*id\s*=\s*["\']filter-toggle["\'][^>]*>\s*<summary>(.*?)</summary>',
-            self.html,
-            flags=re.DOTALL,
-        )
-        assert summary_match is not None, (
+        summary = self.summaries.get("filter-toggle")
+        assert summary is not None, (
             "Expected <summary> inside <details id='filter-toggle'>"
         )
-        assert "filter" in summary_match.group(1).lower(), (
+        assert "filter" in summary.lower(), (
             "Expected 'Filters' text in the filter panel summary"
         )
 
@@ -247,13 +259,19 @@ class TestFilterPanelHTML:
 
     def test_filter_panel_between_add_btn_and_table(self) -> None:
         """Filter panel must appear after add-record-btn and before the <table>."""
-        add_btn_pos = self.html.find("add-record-btn")
-        filter_pos = self.html.find('id="filter-toggle"')
-        table_pos = self.html.find("<table")
-
-        assert add_btn_pos != -1, "Expected add-record-btn in table.html"
-        assert filter_pos != -1, "Expected filter-toggle in table.html"
-        assert table_pos != -1, "Expected <table> in table.html"
+        # One walk over the parsed tags records each element's first position
+        positions: dict[str, int] = {}
+        for index, (tag, attrs) in enumerate(self.tags):
+            key = "table" if tag == "table" else attrs.get("id")
+            if key in ("add-record-btn", "filter-toggle", "table"):
+                positions.setdefault(key, index)
+        add_btn_pos = positions.get("add-record-btn")
+        filter_pos = positions.get("filter-toggle")
+        table_pos = positions.get("table")
+
+        assert add_btn_pos is not None, "Expected add-record-btn in table.html"
+        assert filter_pos is not None, "Expected filter-toggle in table.html"
+        assert table_pos is not None, "Expected <table> in table.html"
         assert add_btn_pos < filter_pos < table_pos, (
             "Filter panel must appear after add-record-btn and before <table>"
         )
@@ -381,7 +399,7 @@ class TestApplyFilters:
         """Must reset pagination to page 1."""
         assert self.fn_body is not None
         # Verify it explicitly appends page=1
-        assert re.search(r'append\(\s*"page"\s*,\s*"1"\s*\)', self.fn_body), (
+        assert _PAGE_RESET_RE.search(self.fn_body), (
             "applyFilters must append page=1 to reset pagination"
         )
 
@@ -519,9 +537,7 @@ class TestReapplySort:
         # reapplySort must NOT reassign sortDirection — only read it for comparisons.
         # We check for assignment patterns (= without preceding =, !, <, >) to
         # distinguish from === comparisons.
-        has_assignment = bool(
-            re.search(r"TableState\.sortDirection\s*=[^=]", self.fn_body)
-        )
+        has_assignment = bool(_SORT_DIRECTION_ASSIGN_RE.search(self.fn_body))
         assert not has_assignment, (
             "reapplySort must NOT assign to TableState.sortDirection — "
             "it should preserve the current direction, not toggle it"
@@ -684,27 +700,27 @@ class TestFilterPanelCSS:
 
     def test_filter_toggle_has_styling(self) -> None:
         """#filter-toggle must have CSS rules."""
-        blocks = _find_blocks(self.css, "#filter-toggle")
+        blocks = find_blocks(self.css, "#filter-toggle")
         assert len(blocks) > 0, "Expected CSS rules for #filter-toggle"
 
     def test_filter_inputs_has_styling(self) -> None:
         """#filter-inputs must have CSS rules."""
-        blocks = _find_blocks(self.css, "#filter-inputs")
+        blocks = find_blocks(self.css, "#filter-inputs")
         assert len(blocks) > 0, "Expected CSS rules for #filter-inputs"
 
     def test_filter_buttons_has_styling(self) -> None:
         """.filter-buttons must have CSS rules for button layout."""
-        blocks = _find_blocks(self.css, ".filter-buttons")
+        blocks = find_blocks(self.css, ".filter-buttons")
         assert len(blocks) > 0, "Expected CSS rules for .filter-buttons"
 
     def test_btn_secondary_exists(self) -> None:
         """.btn-secondary must exist for the Clear button."""
-        blocks = _find_blocks(self.css, ".btn-secondary")
+        blocks = find_blocks(self.css, ".btn-secondary")
         assert len(blocks) > 0, "Expected .btn-secondary CSS for Clear button"
 
     def test_select_input_styled(self) -> None:
         """<select> elements in filter panel must be styled."""
-        blocks = _find_blocks(self.css, "select")
+        blocks = find_blocks(self.css, "select")
         assert len(blocks) > 0, "Expected CSS rules for select elements"
 
 
@@ -724,9 +740,12 @@ class TestFilterPanelAcceptanceCriteria:
 
     def test_filter_panel_is_collapsible_details(self) -> None:
         """AC: Filter panel appears as collapsible <details id='filter-toggle'> on table page."""
-        assert re.search(
-            r'<details[^>]*id\s*=\s*["\']filter-toggle["\']', self.html
-        ), "Expected <details id='filter-toggle'> in table.html"
+        details_ids = [
+            attrs.get("id") for tag, attrs in _parse_html(self.html).tags if tag == "details"
+        ]
+        assert "filter-toggle" in details_ids, (
+            "Expected <details id='filter-toggle'> in table.html"
+        )
 
     def test_inputs_match_field_types(self) -> None:
         """AC: renderFilterPanel creates text, select, and datetime-local inputs."""
@@ -775,7 +794,7 @@ class TestFilterPanelAcceptanceCriteria:
         """AC: applyFilters resets pagination to page 1."""
         apply_body = _extract_js_function_body(self.js, "applyFilters")
         assert apply_body is not None
-        assert re.search(r'append\(\s*"page"\s*,\s*"1"\s*\)', apply_body), (
+        assert _PAGE_RESET_RE.search(apply_body), (
             "AC: applyFilters must set page=1"
         )
 
@@ -848,24 +867,24 @@ class TestExistingFunctionalityPreservedWithFilters:
 
     def test_col_hidden_class_still_exists(self) -> None:
         """style.css must still define .col-hidden."""
-        col_hidden_blocks = _find_blocks(self.css, "col-hidden")
+        col_hidden_blocks = find_blocks(self.css, "col-hidden")
         assert len(col_hidden_blocks) > 0, "Expected .col-hidden CSS"
 
     def test_sortable_header_class_still_exists(self) -> None:
         """style.css must still define .sortable-header."""
-        sortable_blocks = _find_blocks(self.css, "sortable-header")
+        sortable_blocks = find_blocks(self.css, "sortable-header")
         assert len(sortable_blocks) > 0, "Expected .sortable-header CSS"
 
     def test_hover_style_preserved(self) -> None:
         """tbody tr:hover background style must still work."""
-        hover_blocks = _find_blocks(self.css, "tbody tr:hover")
+        hover_blocks = find_blocks(self.css, "tbody tr:hover")
         assert len(hover_blocks) > 0, "tbody tr:hover CSS rule must still exist"
 
     def test_tbody_tr_cursor_pointer_preserved(self) -> None:
         """tbody tr must still have cursor: pointer."""
-        tbody_tr_blocks = _find_blocks(self.css, "tbody tr")
+        tbody_tr_blocks = find_blocks(self.css, "tbody tr")
         has_pointer = any(
-            _css_has_property(body, "cursor", "pointer")
+            css_has_property(body, "cursor", "pointer")
             for body in tbody_tr_blocks
         )
         assert has_pointer, "Expected cursor: pointer on 'tbody tr'"
@@ -876,6 +895,13 @@ class TestExistingFunctionalityPreservedWithFilters:
 # ===================================================================
 
 
+@pytest.fixture(scope="module")
+def list_param_names(openapi_schema: dict) -> frozenset[str]:
+    """Query parameter names of GET /api/v1/bots, extracted once."""
+    get_op = openapi_schema["paths"]["/api/v1/bots"]["get"]
+    return frozenset(p["name"] for p in get_op.get("parameters", []))
+
+
 class TestFilterQueryParamsAPI:
     """Test that filter query params work end-to-end via the API."""
 
@@ -890,7 +916,7 @@ class TestFilterQueryParamsAPI:
         data = response.json()
         items = data["items"]
         assert len(items) == 2
-        assert all(b["rig_id"] == "rig-A" for b in items)
+        assert {b["rig_id"] for b in items} == {"rig-A"}
 
     def test_get_bots_with_bool_filter(self, client, bot_factory):
         """GET /api/v1/bots?kill_switch=true returns only matching bots."""
@@ -903,7 +929,7 @@ class TestFilterQueryParamsAPI:
         data = response.json()
         items = data["items"]
         assert len(items) == 2
-        assert all(b["kill_switch"] is True for b in items)
+        assert {b["kill_switch"] for b in items} == {True}
 
     def test_get_bots_with_ilike_filter(self, client, bot_factory):
         """GET /api/v1/bots?log_search=error returns bots with matching logs."""
@@ -945,62 +971,30 @@ class TestFilterQueryParamsAPI:
         assert items[0]["rig_id"] == "rig-A"
         assert items[0]["kill_switch"] is True
 
-    def test_openapi_spec_lists_filter_params(self, client):
-        """GET /openapi.json must list filter query parameters for the bots endpoint."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        spec = response.json()
-
-        # Find the GET /api/v1/bots endpoint
-        bots_path = spec.get("paths", {}).get("/api/v1/bots", {})
-        get_op = bots_path.get("get", {})
-        params = get_op.get("parameters", [])
-
-        param_names = [p["name"] for p in params]
-
-        # Check that known filter params are present
-        assert "rig_id" in param_names, "Expected rig_id filter param in OpenAPI spec"
-        assert "kill_switch" in param_names, "Expected kill_switch filter param in OpenAPI spec"
-        assert "log_search" in param_names, "Expected log_search filter param in OpenAPI spec"
-
-    def test_openapi_spec_lists_date_range_params(self, client):
-        """GET /openapi.json must list DATE_RANGE _after/_before params."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        spec = response.json()
-
-        bots_path = spec.get("paths", {}).get("/api/v1/bots", {})
-        get_op = bots_path.get("get", {})
-        params = get_op.get("parameters", [])
-
-        param_names = [p["name"] for p in params]
-
-        assert "create_at_after" in param_names, (
-            "Expected create_at_after date range param in OpenAPI spec"
-        )
-        assert "create_at_before" in param_names, (
-            "Expected create_at_before date range param in OpenAPI spec"
+    @pytest.mark.parametrize(
+        "param_name",
+        [
+            # Filters
+            "rig_id",
+            "kill_switch",
+            "log_search",
+            # DATE_RANGE _after/_before pair
+            "create_at_after",
+            "create_at_before",
+            # Pagination must still be listed alongside the filters
+            "page",
+            "per_page",
+        ],
+    )
+    def test_openapi_spec_lists_query_param(self, list_param_names, param_name: str):
+        """GET /openapi.json must list each filter and pagination query param for bots."""
+        assert param_name in list_param_names, (
+            f"Expected {param_name} query param in OpenAPI spec"
         )
 
-    def test_openapi_spec_has_pagination_params(self, client):
-        """Pagination params (page, per_page) must still be in the OpenAPI spec."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        spec = response.json()
-
-        bots_path = spec.get("paths", {}).get("/api/v1/bots", {})
-        get_op = bots_path.get("get", {})
-        params = get_op.get("parameters", [])
-
-        param_names = [p["name"] for p in params]
-
-        assert "page" in param_names, "Expected page pagination param in OpenAPI spec"
-        assert "per_page" in param_names, "Expected per_page pagination param in OpenAPI spec"
-
     def test_filter_with_pagination_resets_to_page_one(self, client, bot_factory):
         """Filtering with page=1 should return the first page of results."""
-        for i in range(5):
-            bot_factory(rig_id="rig-test")
+        bot_factory.bulk(5, rig_id="rig-test")
 
         response = client.get("/api/v1/bots?rig_id=rig-test&page=1&per_page=2")
         assert response.status_code == 200
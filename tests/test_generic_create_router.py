@@ -160,7 +160,7 @@ class TestGenericCreateSuccess:
         gadget_client.post("/gadgets", json={"name": "widget-persisted"})
         response = gadget_client.get("/gadgets")
         items = response.json()["items"]
-        assert any(item["name"] == "widget-persisted" for item in items)
+        assert "widget-persisted" in {item["name"] for item in items}
 
 
 class TestGenericCreateValidation:
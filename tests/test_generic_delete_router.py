@@ -400,8 +400,9 @@ class TestGenericDeleteMultipleRecords:
             assert resp.status_code == 204
 
         list_resp = gadget_client.get("/gadgets")
-        assert list_resp.json()["total"] == 0
-        assert list_resp.json()["items"] == []
+        data = list_resp.json()
+        assert data["total"] == 0
+        assert data["items"] == []
 
     def test_create_after_delete_succeeds(self, gadget_client: TestClient) -> None:
         """New records can be created after deleting existing ones."""
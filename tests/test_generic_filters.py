@@ -88,7 +88,7 @@ class TestApplyFiltersExact:
         filtered = apply_filters(query, Widget, config, {"name": "alpha"})
         results = widget_session.execute(filtered).scalars().all()
         assert len(results) == 2
-        assert all(w.name == "alpha" for w in results)
+        assert {w.name for w in results} == {"alpha"}
 
     def test_exact_match_bool(self, widget_session, widget_factory):
         """EXACT filter on bool column returns only matching rows."""
@@ -179,6 +179,17 @@ class TestApplyFiltersIlike:
         assert len(results) == 1
         assert results[0].name == "a"
 
+    def test_ilike_escapes_all_special_characters_in_pattern(self):
+        """Backslash, % and _ are each escaped once in the bound LIKE pattern."""
+        from jm_api.api.generic.filters import FilterField, FilterType, apply_filters
+
+        config = [FilterField("description", FilterType.ILIKE, param_name="desc_search")]
+        filtered = apply_filters(
+            sa.select(Widget), Widget, config, {"desc_search": "C:\\50%_x"}
+        )
+        params = filtered.compile().params
+        assert list(params.values()) == ["%C:\\\\50\\%\\_x%"]
+
     def test_ilike_none_skipped(self, widget_session, widget_factory):
         """None value for ILIKE filter is ignored."""
         from jm_api.api.generic.filters import FilterField, FilterType, apply_filters
@@ -192,6 +203,23 @@ class TestApplyFiltersIlike:
         results = widget_session.execute(filtered).scalars().all()
         assert len(results) == 2
 
+    def test_ilike_compiles_per_dialect(self):
+        """PostgreSQL gets a native (trigram-indexable) ILIKE; SQLite falls back to LIKE."""
+        from sqlalchemy.dialects import postgresql, sqlite
+
+        from jm_api.api.generic.filters import FilterField, FilterType, apply_filters
+
+        config = [FilterField("description", FilterType.ILIKE, param_name="desc_search")]
+        filtered = apply_filters(sa.select(Widget), Widget, config, {"desc_search": "50%"})
+
+        pg_sql = str(filtered.compile(dialect=postgresql.dialect()))
+        sqlite_sql = str(filtered.compile(dialect=sqlite.dialect()))
+
+        assert "widgets.description ILIKE" in pg_sql
+        assert "ESCAPE" in pg_sql
+        assert "ILIKE" not in sqlite_sql
+        assert "LIKE" in sqlite_sql
+
 
 class TestApplyFiltersDateRange:
     """DATE_RANGE filter type tests."""
@@ -0,0 +1,100 @@
+"""Tests for generic keyset pagination helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from jm_api.api.generic.pagination import (
+    InvalidCursorError,
+    apply_cursor,
+    decode_cursor,
+    encode_cursor,
+)
+from jm_api.models.bot import Bot
+
+SORT = [("create_at", "desc"), ("id", "desc")]
+
+
+class TestCursorEncoding:
+    """Test encode_cursor / decode_cursor round-trips."""
+
+    def test_round_trip_preserves_values(self) -> None:
+        bot = Bot(rig_id="rig-001")
+        bot.create_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(bot, SORT)
+
+        assert decode_cursor(cursor, Bot, SORT) == [bot.create_at, bot.id]
+
+    def test_cursor_is_url_safe(self) -> None:
+        cursor = encode_cursor(Bot(rig_id="rig-001"), SORT)
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not base64!",
+            "bm90IGpzb24",  # "not json"
+            "WzFd",  # [1] — wrong arity
+            "WyJub3QtYS1kYXRlIiwiYWJjIl0",  # ["not-a-date","abc"]
+            "WyIyMDI0LTAxLTAxVDAwOjAwOjAwIix7IngiOjF9XQ",  # ["2024-01-01T00:00:00",{"x":1}]
+            "WyIyMDI0LTAxLTAxVDAwOjAwOjAwIixbImFiYyJdXQ",  # ["2024-01-01T00:00:00",["abc"]]
+            "W3sieCI6MX0sImFiYyJd",  # [{"x":1},"abc"] — object in the datetime slot
+            "WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiw1XQ",  # [<date>,5] — int for a String id
+            "WyIyMDI0LTAxLTAxVDAwOjAwOjAwIix0cnVlXQ",  # [<date>,true] — bool for a String id
+            "WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIixudWxsXQ",  # [<date>,null]
+            "W251bGwsImFiYyJd",  # [null,"abc"]
+            "WzE3MDQwNjcyMDAsImFiYyJd",  # [1704067200,"abc"] — epoch int, not ISO
+        ],
+    )
+    def test_invalid_cursor_raises(self, cursor: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, Bot, SORT)
+
+
+class TestApplyCursor:
+    """Test apply_cursor builds the lexicographic keyset condition."""
+
+    def test_desc_desc_condition(self) -> None:
+        ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        query = apply_cursor(sa.select(Bot), Bot, SORT, [ts, "abc"])
+
+        sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        assert "bots.create_at < " in sql
+        assert "bots.create_at = " in sql
+        assert "bots.id < 'abc'" in sql
+
+    def test_asc_uses_greater_than(self) -> None:
+        query = apply_cursor(sa.select(Bot), Bot, [("rig_id", "asc")], ["rig-005"])
+
+        sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        assert "bots.rig_id > 'rig-005'" in sql
+
+    def test_walks_all_rows_without_overlap(self, db_session: Session) -> None:
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # Two rows per timestamp so the id tie-breaker is exercised
+        for i in range(6):
+            bot = Bot(rig_id=f"rig-{i}")
+            bot.create_at = base.replace(hour=i // 2)
+            db_session.add(bot)
+        db_session.commit()
+
+        seen: list[str] = []
+        query = sa.select(Bot).order_by(Bot.create_at.desc(), Bot.id.desc()).limit(4)
+        page = db_session.execute(query).scalars().all()
+        seen.extend(b.id for b in page)
+        values = decode_cursor(encode_cursor(page[-1], SORT), Bot, SORT)
+        rest = db_session.execute(apply_cursor(query, Bot, SORT, values)).scalars().all()
+        seen.extend(b.id for b in rest)
+
+        assert len(seen) == 6
+        assert len(set(seen)) == 6
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 import sqlalchemy as sa
@@ -320,6 +321,23 @@ class TestGenericGetById:
         assert data["detail"]["message"] == "Widget not found"
         assert data["detail"]["id"] == nonexistent_id
 
+    def test_not_found_body_matches_http_exception(self) -> None:
+        """Pre-rendered 404 body is identical to HTTPException's JSON encoding."""
+        # Arrange
+        from fastapi.responses import JSONResponse
+
+        from jm_api.api.generic.router import _not_found_responder
+
+        item_id = 'quote"back\\slash-é'
+        detail = {"message": "Widget not found", "id": item_id}
+
+        # Act
+        response = _not_found_responder("Widget")(item_id)
+
+        # Assert
+        assert response.status_code == 404
+        assert response.body == JSONResponse({"detail": detail}).body
+
     def test_get_invalid_id_too_short(self, widget_client: TestClient) -> None:
         """Short ID returns 422."""
         response = widget_client.get("/widgets/abc123")
@@ -455,6 +473,127 @@ class TestListEndpointResponseModel:
         assert "$ref" in resp_schema or "properties" in resp_schema
 
 
+class TestResponseSerialization:
+    """Test that handlers serialize with Pydantic and bypass FastAPI's encoders."""
+
+    @pytest.mark.parametrize("path", ["/widgets", "/widgets/{id}"])
+    def test_responses_skip_fastapi_serialization(
+        self, widget_client: TestClient, widget_factory, path: str
+    ) -> None:
+        """Neither response_model re-serialization nor jsonable_encoder runs."""
+        w = widget_factory(name="alpha")
+        with (
+            patch("fastapi.routing.serialize_response") as serialize,
+            patch("fastapi.routing.jsonable_encoder") as encoder,
+        ):
+            response = widget_client.get(path.format(id=w.id))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        serialize.assert_not_called()
+        encoder.assert_not_called()
+
+
+class WidgetSummary(BaseModel):
+    id: str
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TestListColumnProjection:
+    """Test that the list query selects only the columns the list schema needs."""
+
+    def _make_client(self, widget_session: Session, **kwargs) -> TestClient:
+        app = FastAPI()
+
+        def override_get_db():
+            yield widget_session
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.include_router(
+            create_read_router(
+                prefix="/widgets",
+                tags=["widgets"],
+                model=Widget,
+                response_schema=WidgetResponse,
+                filter_config=WIDGET_FILTERS,
+                resource_name="Widget",
+                **kwargs,
+            )
+        )
+        return TestClient(app)
+
+    def test_list_schema_columns_only(
+        self, widget_engine, widget_session: Session, widget_factory, capture_statements
+    ) -> None:
+        """Columns missing from list_schema are not fetched; items use list_schema."""
+        # Arrange
+        widget_factory(name="alpha", description="long text")
+        client = self._make_client(widget_session, list_schema=WidgetSummary)
+
+        # Act
+        with capture_statements(widget_engine) as captured:
+            response = client.get("/widgets")
+
+        # Assert
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [set(item) for item in items] == [{"id", "name"}]
+        selects = [statement for statement, _ in captured if statement.startswith("SELECT")]
+        assert "description" not in selects[0]
+
+    def test_cursor_still_encoded_when_sort_column_not_in_schema(
+        self, widget_engine, widget_session: Session, widget_factory
+    ) -> None:
+        """Sort columns are selected even if list_schema omits them."""
+        # Arrange
+        for name in ("a", "b", "c"):
+            widget_factory(name=name)
+        client = self._make_client(widget_session, list_schema=WidgetSummary)
+
+        # Act
+        first = client.get("/widgets", params={"per_page": 2}).json()
+        second = client.get(
+            "/widgets", params={"per_page": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        # Assert
+        assert first["next_cursor"] is not None
+        assert [item["name"] for item in first["items"] + second["items"]] == ["c", "b", "a"]
+
+    def test_list_schema_field_not_a_column_raises(self) -> None:
+        """A list_schema field with no table column fails at router construction."""
+
+        class WidgetWithLabel(WidgetSummary):
+            label: str
+
+        with pytest.raises(ValueError, match="label"):
+            create_read_router(
+                prefix="/widgets",
+                tags=["widgets"],
+                model=Widget,
+                response_schema=WidgetResponse,
+                filter_config=WIDGET_FILTERS,
+                resource_name="Widget",
+                list_schema=WidgetWithLabel,
+            )
+
+    def test_get_by_id_uses_full_response_schema(
+        self, widget_engine, widget_session: Session, widget_factory
+    ) -> None:
+        """Single-item GET keeps every response_schema field."""
+        # Arrange
+        w = widget_factory(name="alpha", description="long text")
+        client = self._make_client(widget_session, list_schema=WidgetSummary)
+
+        # Act
+        response = client.get(f"/widgets/{w.id}")
+
+        # Assert
+        assert response.json()["description"] == "long text"
+
+
 class TestUniqueRouteNames:
     """Test that routers produce resource-specific function names."""
 
@@ -12,3 +12,11 @@ def test_health_check_returns_ok_and_request_id() -> None:
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
     assert "x-request-id" in response.headers
+
+
+def test_create_app_returns_cached_instance() -> None:
+    assert create_app() is create_app()
+
+
+def test_create_app_prebuilds_openapi_schema() -> None:
+    assert create_app().openapi_schema is not None
@@ -3,11 +3,16 @@
 import re
 import time
 from datetime import datetime, timezone
+from pathlib import Path
 
+import pytest
+import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 from jm_api.models.bot import Bot
 
+ROOT = Path(__file__).resolve().parent.parent
+
 
 def test_bot_id_generated_and_format(db_session: Session) -> None:
     """Bot ID is auto-generated as 32-char alphanumeric string."""
@@ -45,3 +50,70 @@ def test_bot_timestamps_create_and_update(db_session: Session) -> None:
     db_session.refresh(bot)
 
     assert bot.last_update_at > original_updated
+
+
+def test_bot_list_indexes_created(db_session: Session) -> None:
+    """Indexes backing the list endpoint's filters and sort order exist."""
+    index_names = {
+        index["name"] for index in sa.inspect(db_session.get_bind()).get_indexes("bots")
+    }
+
+    assert {
+        "ix_bots_create_at_id",
+        "ix_bots_rig_id_create_at",
+        "ix_bots_kill_switch_create_at",
+        "ix_bots_last_run_at",
+    } <= index_names
+
+
+def test_bot_indexes_shipped_as_sql() -> None:
+    """sql/bots_indexes.sql creates every index declared on the model."""
+    sql = (ROOT / "sql" / "bots_indexes.sql").read_text()
+    shipped = set(re.findall(r"CREATE INDEX CONCURRENTLY IF NOT EXISTS (\w+)", sql))
+
+    assert shipped == {ix.name for ix in Bot.__table__.indexes}
+    # Plain CREATE INDEX would block writes to bots for the whole build
+    assert sql.count("CREATE INDEX") == len(shipped)
+    # The trigram index's operator class comes from pg_trgm
+    assert sql.index("CREATE EXTENSION IF NOT EXISTS pg_trgm") < sql.index(
+        "ix_bots_last_run_log_trgm"
+    )
+
+
+def test_bot_log_trigram_index_postgresql_only(db_session: Session) -> None:
+    """Trigram index on last_run_log is emitted for PostgreSQL and skipped on SQLite."""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    index = next(ix for ix in Bot.__table__.indexes if ix.name == "ix_bots_last_run_log_trgm")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    sqlite_indexes = {
+        ix["name"] for ix in sa.inspect(db_session.get_bind()).get_indexes("bots")
+    }
+
+    assert "USING gin (last_run_log gin_trgm_ops)" in ddl
+    assert "ix_bots_last_run_log_trgm" not in sqlite_indexes
+
+
+@pytest.mark.parametrize(
+    ("where", "index_name"),
+    [
+        ("1 = 1", "ix_bots_create_at_id"),
+        ("rig_id = 'rig-001'", "ix_bots_rig_id_create_at"),
+        ("kill_switch = 1", "ix_bots_kill_switch_create_at"),
+    ],
+)
+def test_bot_list_queries_read_in_index_order(
+    db_session: Session, where: str, index_name: str
+) -> None:
+    """Filtered list queries use a composite index and need no separate sort step."""
+    plan = db_session.execute(
+        sa.text(
+            f"EXPLAIN QUERY PLAN SELECT * FROM bots WHERE {where} "
+            "ORDER BY create_at DESC, id DESC LIMIT 20"
+        )
+    ).all()
+    details = " ".join(row[-1] for row in plan)
+
+    assert index_name in details
+    assert "TEMP B-TREE" not in details
@@ -13,6 +13,8 @@ import re
 
 import pytest
 
+from css_helpers import css_blocks, css_has_property, find_blocks
+
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
 
@@ -23,28 +25,6 @@ def _read_static(filename: str) -> str:
     return path.read_text()
 
 
-def _css_blocks(css: str) -> list[tuple[str, str]]:
-    """Return list of (selector, body) tuples from CSS text."""
-    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
-    blocks: list[tuple[str, str]] = []
-    for match in re.finditer(r"([^{}]+)\{([^}]*)\}", css):
-        selector = match.group(1).strip()
-        body = match.group(2).strip()
-        blocks.append((selector, body))
-    return blocks
-
-
-def _find_blocks(css: str, selector_pattern: str) -> list[str]:
-    """Return CSS bodies for all selectors matching *selector_pattern* (substring)."""
-    return [body for sel, body in _css_blocks(css) if selector_pattern in sel]
-
-
-def _css_has_property(body: str, prop: str, value: str) -> bool:
-    """Check if a CSS body string contains ``prop: value``."""
-    pattern = rf"{re.escape(prop)}\s*:\s*{re.escape(value)}"
-    return bool(re.search(pattern, body))
-
-
 # ===================================================================
 # Issue 1: XSS — HTML-escape cell values and header names
 # ===================================================================
@@ -230,11 +210,11 @@ class TestCSSCursorScoping:
 
         The reviewer noted this is too broad and affects all tables on all pages.
         """
-        blocks = _css_blocks(self.css)
+        blocks = css_blocks(self.css)
         for selector, body in blocks:
             # Match bare 'th' selector (not 'th.something' or '#x th')
             if selector.strip() == "th":
-                assert not _css_has_property(body, "cursor", "pointer"), (
+                assert not css_has_property(body, "cursor", "pointer"), (
                     "Bare 'th' selector must NOT have cursor: pointer — "
                     "it should be scoped to .sortable-header or #data-table th"
                 )
@@ -244,8 +224,8 @@ class TestCSSCursorScoping:
         or #data-table th.
         """
         has_scoped_pointer = False
-        for selector, body in _css_blocks(self.css):
-            if _css_has_property(body, "cursor", "pointer"):
+        for selector, body in css_blocks(self.css):
+            if css_has_property(body, "cursor", "pointer"):
                 if any(
                     scope in selector
                     for scope in [
@@ -412,15 +392,15 @@ class TestExistingFeaturesPreserved:
 
     def test_col_hidden_css_still_exists(self) -> None:
         """.col-hidden CSS rule must still exist."""
-        blocks = _find_blocks(self.css, "col-hidden")
+        blocks = find_blocks(self.css, "col-hidden")
         assert len(blocks) > 0
 
     def test_tbody_tr_still_has_cursor_pointer(self) -> None:
         """tbody tr must still have cursor: pointer for row clickability."""
         # Exclude hover and nth-child rules, keep only plain tbody tr rules
-        non_hover = [b for s, b in _css_blocks(self.css) if "tbody tr" in s and "hover" not in s and "nth" not in s]
+        non_hover = [b for s, b in css_blocks(self.css) if "tbody tr" in s and "hover" not in s and "nth" not in s]
         has_pointer = any(
-            _css_has_property(body, "cursor", "pointer")
+            css_has_property(body, "cursor", "pointer")
             for body in non_hover
         )
         assert has_pointer, "tbody tr must still have cursor: pointer"
@@ -8,44 +8,27 @@ Covers all three sub-tasks:
 
 import pathlib
 import re
+from functools import lru_cache
 
 import pytest
 
+from css_helpers import css_has_property, find_blocks
+
 STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "src" / "jm_api" / "static"
 
 
+@lru_cache(maxsize=8)
 def _read_static(filename: str) -> str:
-    """Read a static file's text content from disk."""
+    """Read a static file's text content from disk, once per filename."""
     path = STATIC_DIR / filename
     assert path.exists(), f"Expected static file not found: {path}"
     return path.read_text()
 
 
-# ---------------------------------------------------------------------------
-# CSS helpers (reused from test_admin_css_improvements pattern)
-# ---------------------------------------------------------------------------
-
-
-def _css_blocks(css: str) -> list[tuple[str, str]]:
-    """Return list of (selector, body) tuples from CSS text."""
-    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
-    blocks: list[tuple[str, str]] = []
-    for match in re.finditer(r"([^{}]+)\{([^}]*)\}", css):
-        selector = match.group(1).strip()
-        body = match.group(2).strip()
-        blocks.append((selector, body))
-    return blocks
-
-
-def _find_blocks(css: str, selector_pattern: str) -> list[str]:
-    """Return CSS bodies for all selectors matching *selector_pattern* (substring)."""
-    return [body for sel, body in _css_blocks(css) if selector_pattern in sel]
-
-
-def _css_has_property(body: str, prop: str, value: str) -> bool:
-    """Check if a CSS body string contains ``prop: value``."""
-    pattern = rf"{re.escape(prop)}\s*:\s*{re.escape(value)}"
-    return bool(re.search(pattern, body))
+@lru_cache(maxsize=8)
+def _read_static_lower(filename: str) -> str:
+    """Lowercased static file content, for case-insensitive tag checks."""
+    return _read_static(filename).lower()
 
 
 # ===================================================================
@@ -136,9 +119,9 @@ class TestRowClickCursorStyle:
     def test_tbody_tr_cursor_pointer(self) -> None:
         """style.css must set cursor: pointer on tbody tr."""
         # Look for a rule targeting tbody tr (could be "tbody tr", "tbody > tr", etc.)
-        tbody_tr_blocks = _find_blocks(self.css, "tbody tr")
+        tbody_tr_blocks = find_blocks(self.css, "tbody tr")
         has_pointer = any(
-            _css_has_property(body, "cursor", "pointer")
+            css_has_property(body, "cursor", "pointer")
             for body in tbody_tr_blocks
         )
         assert has_pointer, (
@@ -147,7 +130,7 @@ class TestRowClickCursorStyle:
 
     def test_hover_background_still_present(self) -> None:
         """The existing tbody tr:hover background style must be preserved."""
-        hover_blocks = _find_blocks(self.css, "tbody tr:hover")
+        hover_blocks = find_blocks(self.css, "tbody tr:hover")
         assert len(hover_blocks) > 0, (
             "tbody tr:hover rule must still exist in style.css"
         )
@@ -168,7 +151,7 @@ class TestColumnSortingJavaScript:
     @pytest.fixture(autouse=True)
     def _load_js(self) -> None:
         self.js = _read_static("app.js")
-        self.js_lower = self.js.lower()
+        self.js_lower = _read_static_lower("app.js")
 
     def test_th_click_handler_exists(self) -> None:
         """Column headers (<th>) must be clickable to trigger sorting.
@@ -311,7 +294,7 @@ class TestColumnVisibilityToggleHTML:
     @pytest.fixture(autouse=True)
     def _load_html(self) -> None:
         self.html = _read_static("table.html")
-        self.html_lower = self.html.lower()
+        self.html_lower = _read_static_lower("table.html")
 
     def test_details_summary_wrapper(self) -> None:
         """Column toggles must be wrapped in <details><summary>Columns</summary>.
@@ -362,7 +345,7 @@ class TestColumnVisibilityToggleJS:
     @pytest.fixture(autouse=True)
     def _load_js(self) -> None:
         self.js = _read_static("app.js")
-        self.js_lower = self.js.lower()
+        self.js_lower = _read_static_lower("app.js")
 
     def test_renders_checkboxes_per_column(self) -> None:
         """One checkbox per column header must be rendered.
@@ -447,7 +430,7 @@ class TestColumnVisibilityCSS:
     @pytest.fixture(autouse=True)
     def _load_css(self) -> None:
         self.css = _read_static("style.css")
-        self.css_lower = self.css.lower()
+        self.css_lower = _read_static_lower("style.css")
 
     def test_col_hidden_class_exists(self) -> None:
         """style.css must define .col-hidden with display: none.
@@ -455,12 +438,12 @@ class TestColumnVisibilityCSS:
         Spec: 'Implement via CSS display: none on hidden columns
         (using a class like .col-hidden).'
         """
-        col_hidden_blocks = _find_blocks(self.css, "col-hidden")
+        col_hidden_blocks = find_blocks(self.css, "col-hidden")
         assert len(col_hidden_blocks) > 0, (
             "Expected .col-hidden CSS class in style.css"
         )
         has_display_none = any(
-            _css_has_property(body, "display", "none")
+            css_has_property(body, "display", "none")
             for body in col_hidden_blocks
         )
         assert has_display_none, (
@@ -487,11 +470,11 @@ class TestSortableHeaderCSS:
         headers. The spec says 'Make each column header clickable.'
         Cursor may be on bare 'th', scoped '.sortable-header', or '#data-table th'.
         """
-        th_blocks = _find_blocks(self.css, "th")
-        sortable_blocks = _find_blocks(self.css, "sortable-header")
+        th_blocks = find_blocks(self.css, "th")
+        sortable_blocks = find_blocks(self.css, "sortable-header")
         all_blocks = th_blocks + sortable_blocks
         has_pointer = any(
-            _css_has_property(body, "cursor", "pointer")
+            css_has_property(body, "cursor", "pointer")
             for body in all_blocks
         )
         # Also check for inline style in JS
@@ -516,6 +499,8 @@ class TestExistingFunctionalityPreserved:
         self.js = _read_static("app.js")
         self.html = _read_static("table.html")
         self.css = _read_static("style.css")
+        self.html_lower = _read_static_lower("table.html")
+        self.css_lower = _read_static_lower("style.css")
 
     def test_tables_array_still_defined(self) -> None:
         """TABLES constant must still exist."""
@@ -540,11 +525,11 @@ class TestExistingFunctionalityPreserved:
 
     def test_loading_element_still_in_html(self) -> None:
         """Loading indicator must still be in table.html."""
-        assert "loading" in self.html.lower()
+        assert "loading" in self.html_lower
 
     def test_error_element_still_in_html(self) -> None:
         """Error display must still be in table.html."""
-        assert "error" in self.html.lower()
+        assert "error" in self.html_lower
 
     def test_data_table_element_still_in_html(self) -> None:
         """data-table element must still exist for JS to target."""
@@ -577,12 +562,12 @@ class TestExistingFunctionalityPreserved:
 
     def test_hover_style_preserved(self) -> None:
         """tbody tr:hover background style must still work."""
-        hover_blocks = _find_blocks(self.css, "tbody tr:hover")
+        hover_blocks = find_blocks(self.css, "tbody tr:hover")
         assert len(hover_blocks) > 0, "tbody tr:hover CSS rule must still exist"
 
     def test_alternating_rows_preserved(self) -> None:
         """Alternating row backgrounds must still work."""
-        assert "nth-child" in self.css.lower()
+        assert "nth-child" in self.css_lower
 
     def test_style_links_preserved_in_html(self) -> None:
         """table.html must still link to style.css."""